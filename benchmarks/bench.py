@@ -0,0 +1,256 @@
+"""Wall time and peak memory of the schedulers' hot paths over synthetic workloads
+
+Run from anywhere, either way:
+    python benchmarks/bench.py --tasks 1000 10000 --workers 20 --only grasp
+    python -m benchmarks.bench --save-baseline
+
+Results are compared with benchmarks/baseline.json when it exists.
+"""
+import argparse
+import functools
+import gc
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+if not __package__:
+    # Run by path: put the repository root on sys.path so `src` imports resolve
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.model.task import Task, Priority, Tier, Resource
+from src.model.worker import Worker
+from src.input_handler.synthetic import WorkloadModel
+from src.scheduler.dynamic_grasp import DynamicGRASPScheduler
+from src.scheduler.dynamic_greedy import DynamicGREEDYScheduler
+from src.scheduler.grasp import GRASPScheduler
+from src.scheduler.greedy import GREEDYScheduler
+
+TASK_SIZES = (1000, 10000, 100000)
+WORKER_SIZES = (20, 500, 5000)
+REGIONS = ("sa-unknown-1", "sa-southeast-1", "sa-southeast-2", "sa-southeast-3", "sa-southeast-4")
+DURATIONS = (5.0, 5.0, 10.0, 15.0, 30.0, 60.0)
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+START = datetime(2025, 4, 6)
+MIN_TIMED = 0.2  # Seconds of timed work per case; fast operations are repeated until they reach it
+MAX_REPEAT = 100
+
+def make_tasks(n: int, seed: int = 0) -> List[Task]:
+    """n fresh tasks arriving over one day, with deadlines 1 to 72 hours after arrival"""
+    rng = random.Random(seed)
+    priorities, tiers, resources = list(Priority), list(Tier), list(Resource)
+    tasks = []
+    for k in range(n):
+        arrival = START + timedelta(seconds=rng.randrange(24 * 3600))
+        due = arrival + timedelta(hours=rng.randint(1, 72))
+        tasks.append(Task(f"{k + 1}", rng.choice(priorities), due, rng.choice(REGIONS),
+                          rng.choice(DURATIONS), rng.choice(resources), rng.choice(tiers), arrival))
+    return tasks
+
+def make_fleet(n: int, seed: int = 0) -> List[Worker]:
+    """n workers with random tiers, regions and capacities; one in ten can run any task"""
+    rng = random.Random(seed)
+    tiers = list(Tier)
+    workers = []
+    for k in range(n):
+        if k % 10 == 0:
+            workers.append(Worker(f"W{k + 1}", Tier.TIER5, list(REGIONS), 3))
+        else:
+            regions = rng.sample(REGIONS, rng.randint(1, len(REGIONS)))
+            workers.append(Worker(f"W{k + 1}", rng.choice(tiers), regions, rng.randint(1, 3)))
+    return workers
+
+class Benchmark(NamedTuple):
+    name: str
+    # Builds fresh inputs for (tasks, workers) and returns the operation to time
+    prepare: Callable[[int, int], Callable[[], object]]
+    max_tasks: int
+    max_work: int  # Largest tasks * workers run by default
+
+def _prepare_make_tasks(n_tasks: int, n_workers: int):
+    # Peak memory here is what the loaded tasks themselves cost, per task in bytes_per_task
+    return lambda: make_tasks(n_tasks)
+
+def _prepare_add_task(n_tasks: int, n_workers: int):
+    tasks, workers = make_tasks(n_tasks), make_fleet(n_workers)
+    # Any TIER5 generalist accepts every task
+    targets = [workers[(k * 10) % n_workers] for k in range(n_tasks)]
+    pairs = list(zip(targets, tasks))
+    def run():
+        for worker, task in pairs:
+            worker.add_task(task)
+    return run
+
+def _prepare_greedy_construct(n_tasks: int, n_workers: int):
+    scheduler, tasks = GREEDYScheduler(make_fleet(n_workers)), make_tasks(n_tasks)
+    return lambda: scheduler.construct_solution(tasks)
+
+def _prepare_greedy_simulate(n_tasks: int, n_workers: int):
+    scheduler = GREEDYScheduler(make_fleet(n_workers))
+    solution = scheduler.construct_solution(make_tasks(n_tasks))
+    return lambda: scheduler.simulate_execution(solution)
+
+def _grasp(n_workers: int) -> GRASPScheduler:
+    random.seed(0)
+    return GRASPScheduler(make_fleet(n_workers), seed=0)
+
+def _prepare_grasp_construct(n_tasks: int, n_workers: int):
+    scheduler, tasks = _grasp(n_workers), make_tasks(n_tasks)
+    return lambda: scheduler.construct_solution(tasks)
+
+def _prepare_grasp_local_search(n_tasks: int, n_workers: int):
+    scheduler = _grasp(n_workers)
+    solution = scheduler.construct_solution(make_tasks(n_tasks))
+    return lambda: scheduler.local_search(solution)
+
+@functools.lru_cache(maxsize=None)
+def _workload_model() -> WorkloadModel:
+    return WorkloadModel.fit()
+
+def _prepare_grasp_local_search_synthetic(n_tasks: int, n_workers: int):
+    # Sampled from the daily files: many more eligibility classes per worker than make_tasks
+    model = _workload_model()
+    scheduler = GRASPScheduler(model.fleet(n_workers, seed=0), seed=0)
+    solution = scheduler.construct_solution(list(model.iter_tasks(n_tasks, seed=0)))
+    return lambda: scheduler.local_search(solution)
+
+def _prepare_grasp_evaluate(n_tasks: int, n_workers: int):
+    scheduler = _grasp(n_workers)
+    solution = scheduler.construct_solution(make_tasks(n_tasks))
+    return lambda: scheduler.evaluate_solution(solution)
+
+def _prepare_grasp_simulate(n_tasks: int, n_workers: int):
+    # simulate_execution drains the worker queues that construct_solution filled
+    scheduler = _grasp(n_workers)
+    solution = scheduler.construct_solution(make_tasks(n_tasks))
+    return lambda: scheduler.simulate_execution(solution)
+
+def _prepare_dynamic(scheduler_class):
+    def prepare(n_tasks: int, n_workers: int):
+        random.seed(0)
+        scheduler = scheduler_class(make_fleet(n_workers))
+        for task in make_tasks(n_tasks):
+            scheduler.add_task(task)
+        return lambda: scheduler.run_simulation(48 * 60)
+    return prepare
+
+# The size caps keep the default run to a few minutes; --no-limits lifts them
+BENCHMARKS = (
+    Benchmark("task.make_tasks", _prepare_make_tasks, 100000, 500000000),
+    Benchmark("worker.add_task", _prepare_add_task, 100000, 500000000),
+    Benchmark("greedy.construct_solution", _prepare_greedy_construct, 100000, 50000000),
+    Benchmark("greedy.simulate_execution", _prepare_greedy_simulate, 100000, 5000000),
+    Benchmark("grasp.construct_solution", _prepare_grasp_construct, 100000, 50000000),
+    Benchmark("grasp.local_search", _prepare_grasp_local_search, 10000, 200000),
+    Benchmark("grasp.local_search_synthetic", _prepare_grasp_local_search_synthetic, 10000, 200000),
+    Benchmark("grasp.evaluate_solution", _prepare_grasp_evaluate, 100000, 50000000),
+    Benchmark("grasp.simulate_execution", _prepare_grasp_simulate, 100000, 5000000),
+    Benchmark("dynamic_greedy.run_simulation", _prepare_dynamic(DynamicGREEDYScheduler), 100000, 5000000),
+    Benchmark("dynamic_grasp.run_simulation", _prepare_dynamic(DynamicGRASPScheduler), 1000, 20000),
+    Benchmark("dynamic_grasp_incremental.run_simulation",
+              _prepare_dynamic(functools.partial(DynamicGRASPScheduler, incremental=True)), 10000, 500000),
+)
+
+def measure(benchmark: Benchmark, n_tasks: int, n_workers: int, repeat: int) -> Dict[str, float]:
+    """Best wall time over at least `repeat` runs with fresh inputs, then one traced run for peak memory"""
+    best = float('inf')
+    timed = 0.0
+    runs = 0
+    while runs < repeat or (timed < MIN_TIMED and runs < MAX_REPEAT):
+        run = benchmark.prepare(n_tasks, n_workers)
+        gc.collect()
+        gc.disable()  # As timeit does, so collections triggered by setup garbage are not timed
+        try:
+            started = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - started
+        finally:
+            gc.enable()
+        best = min(best, elapsed)
+        timed += elapsed
+        runs += 1
+
+    run = benchmark.prepare(n_tasks, n_workers)
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds": best, "ops_per_sec": n_tasks / best if best > 0 else float('inf'),
+            "peak_kib": peak / 1024, "bytes_per_task": peak / n_tasks}
+
+def run_suite(task_sizes=TASK_SIZES, worker_sizes=WORKER_SIZES, repeat: int = 3,
+              only: Optional[List[str]] = None, limits: bool = True) -> Dict[str, Dict[str, float]]:
+    """Results keyed 'benchmark[tasks x workers]'; ops are tasks handled per second"""
+    results = {}
+    for benchmark in BENCHMARKS:
+        if only and not any(pattern in benchmark.name for pattern in only):
+            continue
+        for n_tasks in task_sizes:
+            for n_workers in worker_sizes:
+                if limits and (n_tasks > benchmark.max_tasks or n_tasks * n_workers > benchmark.max_work):
+                    continue
+                key = f"{benchmark.name}[{n_tasks}x{n_workers}]"
+                results[key] = measure(benchmark, n_tasks, n_workers, repeat)
+                print(f"{key:48} {results[key]['ops_per_sec']:>12.0f} tasks/s "
+                      f"{results[key]['seconds']:>9.4f}s {results[key]['peak_kib']:>10.0f} KiB "
+                      f"{results[key]['bytes_per_task']:>7.0f} B/task", flush=True)
+    return results
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            threshold: float = 0.2) -> List[str]:
+    """Cases whose throughput fell, or peak memory grew, by more than threshold against the baseline"""
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        if result["ops_per_sec"] < base["ops_per_sec"] * (1 - threshold):
+            regressions.append(f"{key}: {base['ops_per_sec']:.0f} -> {result['ops_per_sec']:.0f} tasks/s")
+        if result["peak_kib"] > base["peak_kib"] * (1 + threshold):
+            regressions.append(f"{key}: {base['peak_kib']:.0f} -> {result['peak_kib']:.0f} KiB peak")
+    return regressions
+
+def load_baseline(path: str) -> Dict[str, Dict[str, float]]:
+    with open(path, mode='r') as f:
+        return json.load(f)["results"]
+
+def save_results(results: Dict[str, Dict[str, float]], path: str):
+    """Write results with enough context to tell whether two files are comparable"""
+    document = {"python": platform.python_version(), "machine": platform.machine(),
+                "created": datetime.now().isoformat(timespec="seconds"), "results": results}
+    with open(path, mode='w') as f:
+        json.dump(document, f, indent=2, sort_keys=True)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the scheduling hot paths")
+    parser.add_argument("--tasks", type=int, nargs="+", default=list(TASK_SIZES))
+    parser.add_argument("--workers", type=int, nargs="+", default=list(WORKER_SIZES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", nargs="+", help="Run benchmarks whose name contains one of these")
+    parser.add_argument("--no-limits", action="store_true", help="Run every size, even the very slow ones")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="JSON baseline to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the baseline")
+    parser.add_argument("--output", help="Also write the results to this JSON file")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown before flagging")
+    args = parser.parse_args()
+
+    results = run_suite(args.tasks, args.workers, args.repeat, args.only, not args.no_limits)
+    if args.output:
+        save_results(results, args.output)
+    if args.save_baseline:
+        save_results(results, args.baseline)
+        print(f"Saved baseline to {args.baseline}")
+    elif os.path.exists(args.baseline):
+        regressions = compare(results, load_baseline(args.baseline), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions above {args.threshold:.0%} against {args.baseline}")
@@ -29,13 +29,13 @@ if __name__ == "__main__":
         Worker("Worker20", Tier.TIER1, ["sa-unknown-1", "sa-southeast-1"], 1),
     ]
 
-    tasks = handler.create_tasks_from_csv("output_by_created_date/data_2025-04-06.csv")
+    tasks = handler.load_tasks("output_by_created_date/data_2025-04-06.csv")
 
     scheduler = GRASPScheduler(workers, alpha=0.2, max_iterations=100)
     best_solution = scheduler.schedule(tasks)
 
     for worker, assigned_tasks in best_solution.items():
-        print(f"\nWorker {worker.name} (Tier {worker.tier.name}, Regions {worker.regions}):")
+        print(f"\nWorker {worker.name} (Tier {worker.tier.name}, Regions {sorted(worker.regions)}):")
         for task in assigned_tasks:
             print(f"  - {task.name} (Priority {task.priority.name}, Due {task.due_date}, Duration {task.estimated_duration})")
 
@@ -1,40 +1,147 @@
+import argparse
 import csv
 import os
-from collections import defaultdict
-from datetime import datetime
+import shutil
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional
 
 input_file = "data.csv"  # Replace with your actual CSV file
 output_dir = "output_by_created_date"
+MAX_OPEN_FILES = 64
 
-# Ensure the output directory exists
-os.makedirs(output_dir, exist_ok=True)
-
-# Dictionary to collect rows grouped by date (YYYY-MM-DD)
-rows_by_date = defaultdict(list)
-
-# Read the input CSV
-with open(input_file, newline='', encoding='utf-8') as csvfile:
-    reader = csv.DictReader(csvfile)
-    header = reader.fieldnames
-
-    for row in reader:
-        # Extract just the date part of CREATED_DATE
-        try:
-            full_datetime = datetime.strptime(row['CREATED_DATE'], "%Y-%m-%d %H:%M:%S")
-            date_only = full_datetime.date().isoformat()  # 'YYYY-MM-DD'
-        except ValueError:
-            print(f"Skipping invalid date: {row['CREATED_DATE']}")
-            continue
-
-        rows_by_date[date_only].append(row)
-
-# Write each group to a new file
-for date_str, rows in rows_by_date.items():
-    output_filename = os.path.join(output_dir, f"data_{date_str}.csv")
-    
-    with open(output_filename, mode='w', newline='', encoding='utf-8') as outfile:
-        writer = csv.DictWriter(outfile, fieldnames=header)
-        writer.writeheader()
-        writer.writerows(rows)
-
-    print(f"Saved {len(rows)} rows to {output_filename}")
+def date_of(created: str) -> Optional[str]:
+    """'YYYY-MM-DD' prefix of a CREATED_DATE value, or None if it does not look like a date"""
+    date_only = created[:10]
+    if (len(date_only) == 10 and date_only[4] == '-' and date_only[7] == '-'
+            and date_only[:4].isdigit() and date_only[5:7].isdigit() and date_only[8:].isdigit()):
+        return date_only
+    return None
+
+class _WriterPool:
+    """Output files by date, at most max_open of them open at once (least recently used is closed)"""
+    def __init__(self, directory: str, header: Optional[List[str]], max_open: int = MAX_OPEN_FILES):
+        self.directory = directory
+        self.header = header
+        self.max_open = max_open
+        self.counts: Dict[str, int] = {}
+        self._open: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def path_for(self, date_str: str) -> str:
+        return os.path.join(self.directory, f"data_{date_str}.csv")
+
+    def write(self, date_str: str, row: List[str]):
+        entry = self._open.get(date_str)
+        if entry is None:
+            entry = self._open_writer(date_str)
+        else:
+            self._open.move_to_end(date_str)
+        entry[1].writerow(row)
+        self.counts[date_str] += 1
+
+    def _open_writer(self, date_str: str) -> tuple:
+        if len(self._open) >= self.max_open:
+            _, (outfile, _) = self._open.popitem(last=False)
+            outfile.close()
+        # Truncate on first use in this run, append after an eviction
+        first_use = date_str not in self.counts
+        outfile = open(self.path_for(date_str), mode='w' if first_use else 'a', newline='', encoding='utf-8')
+        writer = csv.writer(outfile)
+        if first_use:
+            self.counts[date_str] = 0
+            if self.header is not None:
+                writer.writerow(self.header)
+        entry = self._open[date_str] = (outfile, writer)
+        return entry
+
+    def close(self):
+        for outfile, _ in self._open.values():
+            outfile.close()
+        self._open.clear()
+
+def _read_header(path: str) -> tuple:
+    """Header fields and the byte offset where the data rows start"""
+    with open(path, mode='rb') as f:
+        line = f.readline()
+    return next(csv.reader([line.decode('utf-8')])), len(line)
+
+def _lines(path: str, start: int, end: int) -> Iterator[str]:
+    """Decoded lines that begin inside [start, end); start may fall mid-line"""
+    with open(path, mode='rb') as f:
+        f.seek(start - 1)
+        position = start - 1 + len(f.readline())  # Finish the line the previous range owns
+        while position < end:
+            line = f.readline()
+            if not line:
+                break
+            position += len(line)
+            yield line.decode('utf-8')
+
+def _split_range(path: str, start: int, end: int, directory: str, header: Optional[List[str]],
+                 date_column: int, max_open: int) -> Dict[str, int]:
+    writers = _WriterPool(directory, header, max_open)
+    try:
+        for row in csv.reader(_lines(path, start, end)):
+            if not row:
+                continue
+            date_str = date_of(row[date_column]) if len(row) > date_column else None
+            if date_str is None:
+                print(f"Skipping invalid date: {row[date_column] if len(row) > date_column else row}")
+                continue
+            writers.write(date_str, row)
+    finally:
+        writers.close()
+    return writers.counts
+
+def split_by_created_date(path: str = input_file, directory: str = output_dir, processes: int = 1,
+                          max_open: int = MAX_OPEN_FILES) -> Dict[str, int]:
+    """Split an export into one CSV per CREATED_DATE day in a single streaming pass
+
+    Rows are written as they are read, so memory does not grow with the input.
+    With processes > 1 the file is cut into byte ranges at line boundaries; each
+    range is split into its own part directory and the parts are concatenated in
+    range order, giving the same files as the serial pass. Parallel mode assumes
+    no quoted field contains a newline. Returns the number of rows per day.
+    """
+    os.makedirs(directory, exist_ok=True)
+    header, data_start = _read_header(path)
+    date_column = header.index('CREATED_DATE')
+    size = os.path.getsize(path)
+
+    if processes <= 1 or size - data_start < processes:
+        return _split_range(path, data_start, size, directory, header, date_column, max_open)
+
+    step = (size - data_start) // processes
+    bounds = [data_start + k * step for k in range(processes)] + [size]
+    part_dirs = [os.path.join(directory, f".part{k}") for k in range(processes)]
+    for part_dir in part_dirs:
+        os.makedirs(part_dir, exist_ok=True)
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        futures = [pool.submit(_split_range, path, bounds[k], bounds[k + 1], part_dirs[k], None,
+                               date_column, max_open) for k in range(processes)]
+        part_counts = [future.result() for future in futures]
+
+    counts: Dict[str, int] = {}
+    for date_str in sorted(set().union(*part_counts)):
+        with open(os.path.join(directory, f"data_{date_str}.csv"), mode='w', newline='', encoding='utf-8') as outfile:
+            csv.writer(outfile).writerow(header)
+            for part_dir, part in zip(part_dirs, part_counts):
+                if date_str in part:
+                    with open(os.path.join(part_dir, f"data_{date_str}.csv"), newline='', encoding='utf-8') as infile:
+                        shutil.copyfileobj(infile, outfile)
+        counts[date_str] = sum(part.get(date_str, 0) for part in part_counts)
+    for part_dir in part_dirs:
+        shutil.rmtree(part_dir)
+    return counts
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Split a task export into one CSV per creation day")
+    parser.add_argument("input_file", nargs="?", default=input_file)
+    parser.add_argument("--output-dir", default=output_dir)
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--max-open", type=int, default=MAX_OPEN_FILES)
+    args = parser.parse_args()
+
+    counts = split_by_created_date(args.input_file, args.output_dir, args.processes, args.max_open)
+    for date_str, n in counts.items():
+        print(f"Saved {n} rows to {os.path.join(args.output_dir, f'data_{date_str}.csv')}")
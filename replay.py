@@ -0,0 +1,167 @@
+import argparse
+import csv
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date
+from typing import Dict, List, Optional, Set
+from src.model.task import Task, Tier
+from src.model.worker import Worker
+from src.scheduler.dynamic_grasp import DynamicGRASPScheduler
+from src.scheduler.dynamic_greedy import DynamicGREEDYScheduler
+from src.scheduler.grasp import GRASPScheduler
+from src.scheduler.greedy import GREEDYScheduler
+
+import src.input_handler.input_handler as handler
+
+SCHEDULERS = ("greedy", "grasp", "dynamic_greedy", "dynamic_grasp")
+FIELDS = ("day", "scheduler", "tasks", "wall_time", "makespan", "violations", "pending", "utilization")
+
+def default_fleet() -> List[Worker]:
+    """The 20-worker fleet from test.py"""
+    return [
+        Worker("T5-Node1", Tier.TIER5, ["sa-unknown-1", "sa-southeast-1", "sa-southeast-2", "sa-southeast-3", "sa-southeast-4"], 4),
+        Worker("T5-Node2", Tier.TIER5, ["sa-unknown-1", "sa-southeast-1", "sa-southeast-3", "sa-southeast-4"], 3),
+        Worker("T4-Node1", Tier.TIER4, ["sa-unknown-1", "sa-southeast-1", "sa-southeast-2"], 3),
+        Worker("T4-Node2", Tier.TIER4, ["sa-unknown-1", "sa-southeast-3", "sa-southeast-4"], 2),
+        Worker("T4-Node3", Tier.TIER4, ["sa-unknown-1", "sa-southeast-1", "sa-southeast-4"], 2),
+        Worker("T3-Node1", Tier.TIER3, ["sa-unknown-1", "sa-southeast-1", "sa-southeast-2"], 3),
+        Worker("T3-Node2", Tier.TIER3, ["sa-unknown-1", "sa-southeast-3", "sa-southeast-4"], 3),
+        Worker("T3-Node3", Tier.TIER3, ["sa-unknown-1", "sa-southeast-1", "sa-southeast-3"], 2),
+        Worker("T3-Node4", Tier.TIER3, ["sa-unknown-1", "sa-southeast-2", "sa-southeast-4"], 2),
+        Worker("T3-Node5", Tier.TIER3, ["sa-unknown-1", "sa-southeast-1", "sa-southeast-4"], 2),
+        Worker("T3-Node6", Tier.TIER3, ["sa-unknown-1", "sa-southeast-2", "sa-southeast-3"], 2),
+        Worker("T3-Node7", Tier.TIER3, ["sa-unknown-1", "sa-southeast-1"], 3),
+        Worker("T3-Node8", Tier.TIER3, ["sa-unknown-1", "sa-southeast-3"], 3),
+        Worker("T2-Node1", Tier.TIER2, ["sa-unknown-1", "sa-southeast-1"], 2),
+        Worker("T2-Node2", Tier.TIER2, ["sa-unknown-1", "sa-southeast-2"], 2),
+        Worker("T2-Node3", Tier.TIER2, ["sa-unknown-1", "sa-southeast-3"], 1),
+        Worker("T2-Node4", Tier.TIER2, ["sa-unknown-1", "sa-southeast-4"], 1),
+        Worker("T1-Node1", Tier.TIER1, ["sa-unknown-1"], 1),
+        Worker("T1-Node2", Tier.TIER1, ["sa-southeast-1"], 1),
+        Worker("T1-Node3", Tier.TIER1, ["sa-southeast-2"], 1),
+    ]
+
+def _static_metrics(solution: Dict[Worker, List[Task]], tasks: List[Task], n_workers: int) -> Dict[str, float]:
+    """Replay each worker's plan in order from the day's first arrival; a task cannot start before it arrives"""
+    start = min(task.arrival for task in tasks)
+    makespan = busy = 0.0
+    violations = assigned = 0
+    for worker_tasks in solution.values():
+        clock = start
+        for task in worker_tasks:
+            clock = max(clock, task.arrival) + task.estimated_duration
+            busy += task.estimated_duration
+            violations += clock > task.deadline
+        assigned += len(worker_tasks)
+        makespan = max(makespan, clock - start)
+    return {"makespan": makespan, "violations": violations, "pending": len(tasks) - assigned,
+            "utilization": busy / (n_workers * makespan) if makespan > 0 else 0.0}
+
+def _dynamic_metrics(scheduler, tasks: List[Task], n_workers: int) -> Dict[str, float]:
+    """Metrics on the simulation clock, where minute 0 is the day's first arrival"""
+    finished = scheduler.completion_times
+    makespan = max(finished.values(), default=0.0)
+    busy = violations = 0
+    for task in tasks:
+        if task.name in finished:
+            busy += task.estimated_duration
+            violations += finished[task.name] > scheduler.deadline_minutes(task)
+    return {"makespan": makespan, "violations": violations, "pending": len(tasks) - len(finished),
+            "utilization": busy / (n_workers * makespan) if makespan > 0 else 0.0}
+
+def replay_day(day: date, scheduler_name: str, directory: str = handler.DATA_DIR,
+               horizon: float = 48 * 60, iterations: int = 100, seed: Optional[int] = None,
+               use_cache: bool = True) -> Dict[str, object]:
+    """Run one scheduler over one daily file with a fresh default fleet"""
+    tasks = list(handler.iter_tasks_in_range(day, day, directory, use_cache=use_cache))
+    workers = default_fleet()
+    if seed is not None:
+        random.seed(seed)
+
+    started = time.perf_counter()
+    if scheduler_name == "greedy":
+        solution = GREEDYScheduler(workers).schedule(tasks)
+    elif scheduler_name == "grasp":
+        solution = GRASPScheduler(workers, max_iterations=iterations, seed=seed).schedule(tasks)
+    elif scheduler_name == "dynamic_greedy":
+        scheduler = DynamicGREEDYScheduler(workers)
+    else:
+        scheduler = DynamicGRASPScheduler(workers)
+    if scheduler_name.startswith("dynamic"):
+        scheduler.add_task_stream(tasks)
+        scheduler.run_simulation(horizon)
+    wall_time = time.perf_counter() - started
+
+    if not tasks:
+        metrics = {"makespan": 0.0, "violations": 0, "pending": 0, "utilization": 0.0}
+    elif scheduler_name.startswith("dynamic"):
+        metrics = _dynamic_metrics(scheduler, tasks, len(workers))
+    else:
+        metrics = _static_metrics(solution, tasks, len(workers))
+    return {"day": day.isoformat(), "scheduler": scheduler_name, "tasks": len(tasks),
+            "wall_time": round(wall_time, 4), **metrics}
+
+def completed_days(summary_path: str, scheduler_name: str) -> Set[str]:
+    """Days already recorded for this scheduler; a row cut short by a crash does not count"""
+    if not os.path.exists(summary_path):
+        return set()
+    with open(summary_path, newline='') as f:
+        return {row["day"] for row in csv.DictReader(f)
+                if row["scheduler"] == scheduler_name and row.get("utilization")}
+
+def replay_all(scheduler_name: str, summary_path: str, directory: str = handler.DATA_DIR,
+               start: Optional[str] = None, end: Optional[str] = None, processes: int = 1,
+               horizon: float = 48 * 60, iterations: int = 100, seed: Optional[int] = None) -> int:
+    """Replay every daily file in [start, end] not yet in the summary and append a row per day
+
+    Rows are written as days finish, so an interrupted run picks up where it
+    left off. Returns the number of days replayed.
+    """
+    if scheduler_name not in SCHEDULERS:
+        raise ValueError(f"Unknown scheduler '{scheduler_name}', expected one of {SCHEDULERS}")
+    done = completed_days(summary_path, scheduler_name)
+    days = [day for day, _ in handler.daily_files(start, end, directory) if day.isoformat() not in done]
+    if not days:
+        return 0
+
+    new_file = not os.path.exists(summary_path) or os.path.getsize(summary_path) == 0
+    if not new_file:
+        with open(summary_path, mode='rb') as f:
+            f.seek(-1, os.SEEK_END)
+            torn = f.read(1) != b"\n"  # Last row was cut short by an interrupted run
+    with open(summary_path, mode='a', newline='') as summary, \
+            ProcessPoolExecutor(max_workers=processes) as pool:
+        writer = csv.DictWriter(summary, fieldnames=FIELDS)
+        if new_file:
+            writer.writeheader()
+        elif torn:
+            summary.write("\n")
+        futures = {pool.submit(replay_day, day, scheduler_name, directory, horizon, iterations, seed): day
+                   for day in days}
+        for future in as_completed(futures):
+            row = future.result()
+            writer.writerow(row)
+            summary.flush()
+            print(f"{row['day']} {scheduler_name}: {row['tasks']} tasks in {row['wall_time']:.2f}s, "
+                  f"{row['violations']} late, {row['pending']} pending")
+    return len(days)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Replay a scheduler over the daily task files")
+    parser.add_argument("scheduler", choices=SCHEDULERS)
+    parser.add_argument("--summary", help="CSV to append per-day metrics to (default replay_<scheduler>.csv)")
+    parser.add_argument("--data-dir", default=handler.DATA_DIR)
+    parser.add_argument("--start", help="First day, YYYY-MM-DD (default: earliest file)")
+    parser.add_argument("--end", help="Last day, YYYY-MM-DD (default: latest file)")
+    parser.add_argument("--processes", type=int, default=os.cpu_count())
+    parser.add_argument("--horizon", type=float, default=48 * 60, help="Simulation minutes for dynamic schedulers")
+    parser.add_argument("--iterations", type=int, default=100, help="GRASP restarts")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    summary_path = args.summary or f"replay_{args.scheduler}.csv"
+    replayed = replay_all(args.scheduler, summary_path, args.data_dir, args.start, args.end,
+                          args.processes, args.horizon, args.iterations, args.seed)
+    print(f"Replayed {replayed} days into {summary_path}")
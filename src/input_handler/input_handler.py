@@ -1,6 +1,18 @@
 import csv
-from datetime import datetime
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache
+from operator import itemgetter
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
 from src.model.task import Task, Priority, Tier, Resource
+from src.model.task_table import TaskTable, to_minutes
+from src.input_handler.task_cache import open_cache, write_cache
+
+DATA_DIR = "output_by_created_date"
+COLUMNS = ("DUE_TO", "CREATED_DATE", "REGION", "TIER", "PRIORITY", "ESTIMATED_DURATION",
+           "MAXIMUM_WAITING_TIME", "RESOURCE_REQUIREMENT")
 
 
 def parse_date(date_str: str):
@@ -69,4 +81,218 @@ def create_tasks_from_csv(file_path: str) -> list[Task]:
         print(f"An unexpected error occurred: {e}")
         return []
     
-    return tasks
\ No newline at end of file
+    return tasks
+
+def parse_timestamp(date_str: str) -> Optional[datetime]:
+    """Fast parser for 'YYYY-MM-DD HH:MM:SS'; None for anything else"""
+    if len(date_str) != 19 or date_str[10] != ' ':
+        date_str = date_str.strip()
+        if len(date_str) != 19 or date_str[10] != ' ':
+            return None
+    try:
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        return None
+
+# Deadlines repeat a lot (often round hours), creation times rarely do
+_cached_timestamp = lru_cache(maxsize=16384)(parse_timestamp)
+
+class LoadWarning(NamedTuple):
+    row: int
+    field: str
+    value: str
+    message: str
+
+class LoadReport:
+    """Problems found while loading a task file, collected instead of printed"""
+    def __init__(self, file_path: str = ""):
+        self.file_path = file_path
+        self.rows_read = 0
+        self.loaded = 0
+        self.skipped = 0
+        self.warnings: List[LoadWarning] = []
+
+    def warn(self, row: int, field: str, value: str, message: str):
+        self.warnings.append(LoadWarning(row, field, value, message))
+
+    def counts(self) -> Dict[str, int]:
+        """Number of warnings per field"""
+        counts: Dict[str, int] = {}
+        for warning in self.warnings:
+            counts[warning.field] = counts.get(warning.field, 0) + 1
+        return counts
+
+    def __str__(self) -> str:
+        summary = f"{self.file_path}: {self.loaded} loaded, {self.skipped} skipped"
+        if self.warnings:
+            details = ", ".join(f"{field}: {n}" for field, n in self.counts().items())
+            summary += f", {len(self.warnings)} warnings ({details})"
+        return summary
+
+def _iter_rows(file_path: str, report: LoadReport) -> Iterator[tuple]:
+    """Validated (row_num, due, created, region, tier, priority, duration, resource) per data row
+
+    As in create_tasks_from_csv, an invalid priority or resource falls back to
+    MEDIUM, while a row with an invalid tier, or a field that does not parse
+    (including MAXIMUM_WAITING_TIME), is skipped. Both are recorded in the report.
+    """
+    try:
+        with open(file_path, mode='r', newline='') as csvfile:
+            reader = csv.reader(csvfile)
+
+            for row_num, row in enumerate(reader, 1):
+                if row_num == 1 and row and row[0].strip().upper() == COLUMNS[0]:
+                    continue
+                report.rows_read += 1
+                if len(row) < 8:
+                    report.warn(row_num, "row", ",".join(row), "insufficient columns")
+                    report.skipped += 1
+                    continue
+
+                try:
+                    due_date = _cached_timestamp(row[0])
+                    if due_date is None:
+                        report.warn(row_num, COLUMNS[0], row[0], "invalid date, using None")
+                    created_date = parse_timestamp(row[1])
+                    if created_date is None:
+                        report.warn(row_num, COLUMNS[1], row[1], "invalid date, using None")
+                    region = row[2].strip()
+                    tier = int(row[3])
+                    priority = row[4].strip().upper()
+                    duration = float(row[5])
+                    float(row[6])  # MAXIMUM_WAITING_TIME is unused but must parse, as before
+                    resource = row[7].strip().upper()
+                except ValueError as e:
+                    report.warn(row_num, "row", ",".join(row), str(e))
+                    report.skipped += 1
+                    continue
+
+                if duration < 0:
+                    duration = 5.0
+
+                if priority not in Priority.__members__:
+                    report.warn(row_num, COLUMNS[4], priority, "invalid priority, using MEDIUM")
+                    priority = "MEDIUM"
+
+                if resource not in Resource.__members__:
+                    report.warn(row_num, COLUMNS[7], resource, "invalid resource, using MEDIUM")
+                    resource = "MEDIUM"
+
+                if tier not in Tier._value2member_map_:
+                    report.warn(row_num, COLUMNS[3], str(tier), "invalid tier, skipping")
+                    report.skipped += 1
+                    continue
+
+                report.loaded += 1
+                yield row_num, due_date, created_date, region, tier, priority, duration, resource
+
+    except FileNotFoundError:
+        report.warn(0, "file", file_path, "file not found")
+
+def iter_tasks_from_csv(file_path: str, report: Optional[LoadReport] = None) -> Iterator[Task]:
+    """Stream tasks from a daily CSV without holding the file in memory
+
+    The header row is skipped by name and warnings go to `report` instead of stdout.
+    Task names are the CSV line numbers, as in create_tasks_from_csv.
+    """
+    if report is None:
+        report = LoadReport(file_path)
+    for row_num, due_date, created_date, region, tier, priority, duration, resource in _iter_rows(file_path, report):
+        yield Task(f"{row_num}", Priority[priority], due_date, region, duration,
+                   Resource[resource], Tier(tier), created_date)
+
+def create_task_table_from_csv(file_path: str, report: Optional[LoadReport] = None) -> TaskTable:
+    """Columnar load of a daily CSV; warnings go to `report` instead of stdout"""
+    if report is None:
+        report = LoadReport(file_path)
+    table = TaskTable()
+    for row_num, due_date, created_date, region, tier, priority, duration, resource in _iter_rows(file_path, report):
+        table.append(to_minutes(due_date), to_minutes(created_date), Priority[priority].value, tier,
+                     Resource[resource].value, duration, region, row_num)
+    return table
+
+def load_task_table(file_path: str, use_cache: bool = True, check_hash: bool = False,
+                    report: Optional[LoadReport] = None) -> TaskTable:
+    """Columnar tasks for a daily CSV, served from the binary cache next to it when fresh
+
+    A missing or stale cache is rebuilt from the CSV. Parse warnings are only
+    reported on that rebuild; a cache hit just sets report.loaded.
+    """
+    if report is None:
+        report = LoadReport(file_path)
+    if use_cache:
+        table = open_cache(file_path, check_hash=check_hash)
+        if table is not None:
+            report.loaded = len(table)
+            return table
+
+    table = create_task_table_from_csv(file_path, report)
+    if use_cache and len(table):
+        try:
+            write_cache(table, file_path)
+        except OSError as e:
+            report.warn(0, "cache", file_path, f"could not write cache: {e}")
+    return table
+
+def load_tasks(file_path: str, use_cache: bool = True, report: Optional[LoadReport] = None) -> List[Task]:
+    """Task objects for a daily CSV, via load_task_table"""
+    return load_task_table(file_path, use_cache, report=report).tasks()
+
+def daily_files(start: Union[date, str, None] = None, end: Union[date, str, None] = None,
+                directory: str = DATA_DIR) -> List[Tuple[date, str]]:
+    """(day, path) of every data_<day>.csv in the inclusive range, by day; None leaves a side open"""
+    if isinstance(start, str):
+        start = date.fromisoformat(start)
+    if isinstance(end, str):
+        end = date.fromisoformat(end)
+    files = []
+    for file_name in os.listdir(directory):
+        if not (file_name.startswith("data_") and file_name.endswith(".csv")):
+            continue
+        try:
+            day = date.fromisoformat(file_name[5:-4])
+        except ValueError:
+            continue
+        if (start is None or day >= start) and (end is None or day <= end):
+            files.append((day, os.path.join(directory, file_name)))
+    return sorted(files)
+
+def _load_day(day: date, path: str, use_cache: bool) -> Tuple[TaskTable, List[int], LoadReport]:
+    """One day's table with day-qualified task names, and its rows in arrival order"""
+    report = LoadReport(path)
+    table = load_task_table(path, use_cache, report=report)
+    table.name_prefix = f"{day.isoformat()}-"
+    arrival = table.arrival
+    return table, sorted(range(len(table)), key=arrival.__getitem__), report
+
+def _arrivals(table: TaskTable, order: List[int]) -> Iterator[Tuple[float, Task]]:
+    arrival = table.arrival
+    for i in order:
+        yield arrival[i], table.task(i)
+
+def iter_tasks_in_range(start: Union[date, str], end: Union[date, str], directory: str = DATA_DIR,
+                        processes: int = 1, use_cache: bool = True,
+                        reports: Optional[List[LoadReport]] = None) -> Iterator[Task]:
+    """Tasks of every daily file in [start, end], as one stream ordered by CREATED_DATE
+
+    Days are loaded in parallel when processes > 1. Each day's rows are sorted
+    by arrival on their own, and the days are combined with a k-way heap
+    merge, so no global sort is needed. Task names are '<day>-<csv line>' to
+    keep them unique across days. Tasks are built lazily as the stream is read.
+    """
+    files = daily_files(start, end, directory)
+    if processes > 1 and len(files) > 1:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            days = list(pool.map(_load_day, *zip(*files), [use_cache] * len(files)))
+    else:
+        days = [_load_day(day, path, use_cache) for day, path in files]
+
+    if reports is not None:
+        reports.extend(report for _, _, report in days)
+    streams = [_arrivals(table, order) for table, order, _ in days]
+    for _, task in heapq.merge(*streams, key=itemgetter(0)):
+        yield task
+
+def load_tasks_in_range(start: Union[date, str], end: Union[date, str], directory: str = DATA_DIR,
+                        processes: int = 1, use_cache: bool = True) -> List[Task]:
+    return list(iter_tasks_in_range(start, end, directory, processes, use_cache))
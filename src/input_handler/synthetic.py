@@ -0,0 +1,201 @@
+import csv
+import json
+import os
+import random
+from bisect import bisect
+from datetime import datetime, timedelta
+from itertools import accumulate
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from src.model.task import Task, Priority, Tier, Resource
+from src.model.worker import Worker
+from src.input_handler.input_handler import COLUMNS, DATA_DIR, daily_files, parse_timestamp
+
+# Tier mix and per-tier capacities of the reference fleets in main.py and test.py
+FLEET_TIERS = {Tier.TIER1: 0.15, Tier.TIER2: 0.20, Tier.TIER3: 0.40, Tier.TIER4: 0.15, Tier.TIER5: 0.10}
+FLEET_CAPACITY = {Tier.TIER1: (1, 1), Tier.TIER2: (1, 2), Tier.TIER3: (2, 3), Tier.TIER4: (2, 3), Tier.TIER5: (3, 4)}
+GENERALIST_EVERY = 20  # Like T5-Node1, one worker in twenty covers every region at the top tier
+
+class _Empirical:
+    """Discrete distribution over observed values, sampled by bisecting cumulative counts"""
+    def __init__(self, counts: Dict):
+        self.values = list(counts)
+        self.counts = [counts[v] for v in self.values]
+        self._cumulative = list(accumulate(self.counts))
+
+    def sample(self, rng) -> object:
+        return self.values[bisect(self._cumulative, rng.random() * self._cumulative[-1])]
+
+    def to_dict(self) -> dict:
+        return {"values": self.values, "counts": self.counts}
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "_Empirical":
+        return cls(dict(zip(state["values"], state["counts"])))
+
+def _count(counts: Dict, value):
+    counts[value] = counts.get(value, 0) + 1
+
+class WorkloadModel:
+    """Empirical marginals of the daily task files, for sampling workloads of any size
+
+    Each field is sampled independently from its observed distribution: region,
+    tier, priority, resource class, raw ESTIMATED_DURATION (so the -1 sentinel
+    keeps its share), MAXIMUM_WAITING_TIME, due-date lead time in minutes,
+    arrivals per hour of day and tasks per day.
+    """
+    FIELDS = ("region", "tier", "priority", "resource", "duration", "max_wait", "lead", "hour", "daily")
+
+    def __init__(self, distributions: Dict[str, _Empirical]):
+        for field in self.FIELDS:
+            setattr(self, field, distributions[field])
+
+    @classmethod
+    def fit(cls, directory: str = DATA_DIR, start: Optional[str] = None,
+            end: Optional[str] = None) -> "WorkloadModel":
+        counts = {field: {} for field in cls.FIELDS}
+        for _, path in daily_files(start, end, directory):
+            day_tasks = 0
+            with open(path, mode='r', newline='') as csvfile:
+                reader = csv.reader(csvfile)
+                for row in reader:
+                    if len(row) < 8 or row[0].strip().upper() == COLUMNS[0]:
+                        continue
+                    due, created = parse_timestamp(row[0]), parse_timestamp(row[1])
+                    if created is None:
+                        continue
+                    _count(counts["region"], row[2].strip())
+                    _count(counts["tier"], row[3].strip())
+                    _count(counts["priority"], row[4].strip().upper())
+                    _count(counts["duration"], row[5].strip())
+                    _count(counts["max_wait"], row[6].strip())
+                    _count(counts["resource"], row[7].strip().upper())
+                    _count(counts["hour"], created.hour)
+                    if due is not None:
+                        _count(counts["lead"], round((due - created).total_seconds() / 60))
+                    day_tasks += 1
+            if day_tasks:
+                _count(counts["daily"], day_tasks)
+        if not counts["daily"]:
+            raise ValueError(f"No task files found in '{directory}'")
+        return cls({field: _Empirical(c) for field, c in counts.items()})
+
+    def iter_rows(self, n_tasks: int, start: datetime = datetime(2026, 1, 1), seed: Optional[int] = None,
+                  rate: float = 1.0) -> Iterator[Tuple[str, List[str]]]:
+        """(day, CSV row) for n_tasks tasks in arrival order, one sampled day at a time
+
+        Each day's volume is drawn from the observed daily counts times `rate`,
+        so rate=10 packs ten days of traffic into each simulated day.
+        """
+        rng = random.Random(seed)
+        day = datetime(start.year, start.month, start.day)
+        remaining = n_tasks
+        while remaining > 0:
+            volume = min(remaining, max(1, round(self.daily.sample(rng) * rate)))
+            arrivals = sorted(day + timedelta(hours=self.hour.sample(rng), seconds=rng.randrange(3600))
+                              for _ in range(volume))
+            for created in arrivals:
+                due = created + timedelta(minutes=self.lead.sample(rng))
+                yield day.date().isoformat(), [
+                    due.isoformat(' '), created.isoformat(' '),
+                    self.region.sample(rng), self.tier.sample(rng), self.priority.sample(rng),
+                    self.duration.sample(rng), self.max_wait.sample(rng), self.resource.sample(rng)]
+            remaining -= volume
+            day += timedelta(days=1)
+
+    def iter_tasks(self, n_tasks: int, start: datetime = datetime(2026, 1, 1), seed: Optional[int] = None,
+                   rate: float = 1.0) -> Iterator[Task]:
+        """The same workload as iter_rows, as tasks named '<day>-<csv line>' like iter_tasks_in_range"""
+        current_day, line = None, 1
+        for day, row in self.iter_rows(n_tasks, start, seed, rate):
+            if day != current_day:
+                current_day, line = day, 1
+            line += 1
+            duration = float(row[5])
+            # Same fallback for the -1 sentinel as the CSV loaders
+            yield Task(f"{day}-{line}", Priority[row[4]], parse_timestamp(row[0]), row[2],
+                       duration if duration >= 0 else 5.0, Resource[row[7]], Tier(int(row[3])),
+                       parse_timestamp(row[1]))
+
+    def write_csv(self, file_path: str, n_tasks: int, start: datetime = datetime(2026, 1, 1),
+                  seed: Optional[int] = None, rate: float = 1.0):
+        """All tasks in one CSV with the daily files' header"""
+        with open(file_path, mode='w', newline='') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(COLUMNS)
+            for _, row in self.iter_rows(n_tasks, start, seed, rate):
+                writer.writerow(row)
+
+    def write_daily_csvs(self, directory: str, n_tasks: int, start: datetime = datetime(2026, 1, 1),
+                         seed: Optional[int] = None, rate: float = 1.0) -> List[str]:
+        """One data_<day>.csv per simulated day, readable by daily_files and the replay runner"""
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+        csvfile, writer, current_day = None, None, None
+        try:
+            for day, row in self.iter_rows(n_tasks, start, seed, rate):
+                if day != current_day:
+                    if csvfile is not None:
+                        csvfile.close()
+                    current_day = day
+                    paths.append(os.path.join(directory, f"data_{day}.csv"))
+                    csvfile = open(paths[-1], mode='w', newline='')
+                    writer = csv.writer(csvfile)
+                    writer.writerow(COLUMNS)
+                writer.writerow(row)
+        finally:
+            if csvfile is not None:
+                csvfile.close()
+        return paths
+
+    def fleet(self, n_workers: int, seed: Optional[int] = None) -> List[Worker]:
+        """Workers with the reference fleets' tier mix, regions weighted by task demand
+
+        Every worker serves the busiest region, as almost all reference workers
+        serve sa-unknown-1, plus a tier-dependent number of others; one worker in
+        GENERALIST_EVERY covers every region at TIER5 so every task has a home.
+        """
+        rng = random.Random(seed)
+        regions = [r for _, r in sorted(zip(self.region.counts, self.region.values), reverse=True)]
+        busiest, others = regions[0], regions[1:]
+        weights = dict(zip(self.region.values, self.region.counts))
+        tiers = list(FLEET_TIERS)
+        tier_weights = list(FLEET_TIERS.values())
+        workers = []
+        for k in range(n_workers):
+            if k % GENERALIST_EVERY == 0:
+                workers.append(Worker(f"G{k // GENERALIST_EVERY + 1}-Node", Tier.TIER5, list(regions),
+                                      FLEET_CAPACITY[Tier.TIER5][1]))
+                continue
+            tier = rng.choices(tiers, tier_weights)[0]
+            extra = min(len(others), rng.randint(1, 2 + tiers.index(tier) // 2))
+            chosen = _weighted_sample(rng, others, [weights[r] for r in others], extra)
+            low, high = FLEET_CAPACITY[tier]
+            workers.append(Worker(f"{tier.name.replace('TIER', 'T')}-Node{k + 1}", tier, [busiest] + chosen,
+                                  rng.randint(low, high)))
+        return workers
+
+    def to_dict(self) -> dict:
+        return {field: getattr(self, field).to_dict() for field in self.FIELDS}
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "WorkloadModel":
+        return cls({field: _Empirical.from_dict(state[field]) for field in cls.FIELDS})
+
+    def save(self, file_path: str):
+        with open(file_path, mode='w') as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, file_path: str) -> "WorkloadModel":
+        with open(file_path, mode='r') as f:
+            return cls.from_dict(json.load(f))
+
+def _weighted_sample(rng, values: Sequence[str], weights: Sequence[float], k: int) -> List[str]:
+    """k distinct values, each draw weighted among the values not yet drawn"""
+    values, weights = list(values), list(weights)
+    chosen = []
+    for _ in range(k):
+        index = bisect(list(accumulate(weights)), rng.random() * sum(weights))
+        chosen.append(values.pop(index))
+        weights.pop(index)
+    return chosen
@@ -0,0 +1,112 @@
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Optional
+from src.model.task_table import TaskTable
+
+CACHE_SUFFIX = ".tasks"
+CACHE_VERSION = 2  # 2: rows with an invalid tier are skipped
+# magic, version, little-endian flag, sizeof(long), rows, csv mtime_ns, csv size, csv sha1, region bytes
+HEADER = struct.Struct("<4sHBBqqq20sq")
+MAGIC = b"TSKC"
+ALIGNMENT = 8
+# Column name and typecode, in file order
+COLUMNS = (("due", 'd'), ("arrival", 'd'), ("duration", 'f'), ("row", 'l'),
+           ("region", 'h'), ("priority", 'b'), ("tier", 'b'), ("resource", 'b'))
+
+def cache_path_for(csv_path: str) -> str:
+    return os.path.splitext(csv_path)[0] + CACHE_SUFFIX
+
+def file_digest(file_path: str) -> bytes:
+    digest = hashlib.sha1()
+    with open(file_path, mode='rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.digest()
+
+def _padding(offset: int) -> int:
+    return -offset % ALIGNMENT
+
+def write_cache(table: TaskTable, csv_path: str, cache_path: Optional[str] = None) -> str:
+    """Write the table as a fixed-layout binary file stamped with the source CSV's mtime, size and hash
+
+    Columns are stored in native byte order, each aligned to 8 bytes so they can
+    be cast straight out of the mapped file. The file is written under a
+    temporary name and renamed, so readers never see a partial cache.
+    """
+    cache_path = cache_path or cache_path_for(csv_path)
+    stat = os.stat(csv_path)
+    regions = "".join(region + "\n" for region in table.regions).encode("utf-8")
+    header = HEADER.pack(MAGIC, CACHE_VERSION, sys.byteorder == "little", array('l').itemsize,
+                         len(table), stat.st_mtime_ns, stat.st_size, file_digest(csv_path), len(regions))
+
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(temp_path, mode='wb') as f:
+        f.write(header)
+        f.write(regions)
+        f.write(bytes(_padding(HEADER.size + len(regions))))
+        for name, _ in COLUMNS:
+            data = getattr(table, name).tobytes()
+            f.write(data)
+            f.write(bytes(_padding(len(data))))
+    os.replace(temp_path, cache_path)
+    return cache_path
+
+def open_cache(csv_path: str, cache_path: Optional[str] = None,
+               check_hash: bool = False) -> Optional[TaskTable]:
+    """Memory-mapped TaskTable for a CSV, or None if there is no usable cache
+
+    A cache is fresh when the CSV's mtime and size match the stamp. If only the
+    mtime differs (the file was touched or copied), the content hash decides and
+    a matching cache is restamped. check_hash=True always compares the hash.
+    The returned table's columns are read-only views into the mapping; nothing
+    is copied until a task is materialized.
+    """
+    cache_path = cache_path or cache_path_for(csv_path)
+    try:
+        stat = os.stat(csv_path)
+        with open(cache_path, mode='rb') as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    if len(mapping) < HEADER.size:
+        return None
+    magic, version, little, long_size, rows, mtime_ns, size, digest, region_bytes = \
+        HEADER.unpack_from(mapping)
+    if (magic != MAGIC or version != CACHE_VERSION or little != (sys.byteorder == "little")
+            or long_size != array('l').itemsize or size != stat.st_size):
+        return None
+    if check_hash or mtime_ns != stat.st_mtime_ns:
+        if file_digest(csv_path) != digest:
+            return None
+        if mtime_ns != stat.st_mtime_ns:
+            _restamp(cache_path, stat.st_mtime_ns)
+
+    table = TaskTable()
+    offset = HEADER.size
+    for region in mapping[offset:offset + region_bytes].decode("utf-8").split("\n")[:-1]:
+        table.intern_region(region)
+    offset += region_bytes + _padding(HEADER.size + region_bytes)
+
+    view = memoryview(mapping)
+    for name, typecode in COLUMNS:
+        length = rows * array(typecode).itemsize
+        if offset + length > len(mapping):
+            return None
+        setattr(table, name, view[offset:offset + length].cast(typecode))
+        offset += length + _padding(length)
+    return table
+
+def _restamp(cache_path: str, mtime_ns: int):
+    try:
+        with open(cache_path, mode='r+b') as f:
+            fields = list(HEADER.unpack(f.read(HEADER.size)))
+            fields[5] = mtime_ns
+            f.seek(0)
+            f.write(HEADER.pack(*fields))
+    except OSError:
+        pass
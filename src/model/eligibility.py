@@ -0,0 +1,84 @@
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+from array import array
+from src.model.task import Task
+from src.model.worker import Worker
+
+class EligibilityIndex:
+    """Feasible workers per task class (region, tier, resource), built once per fleet"""
+    def __init__(self, workers: List[Worker], metrics=None):
+        self.workers = workers
+        self.metrics = metrics  # Optional scheduler Metrics counting class builds and can_accept checks
+        self._feasible: Dict[tuple, Tuple[Worker, ...]] = {}
+        self._positions: Dict[tuple, Tuple[int, ...]] = {}
+        self._position_sets: Dict[tuple, FrozenSet[int]] = {}
+        self._signature = self._fleet_signature()
+
+    @staticmethod
+    def task_class(task: Task) -> tuple:
+        """Key shared by every task with the same feasibility constraints"""
+        return (task.region, task.tier.value, task.resource_requirements.value)
+
+    def feasible_workers(self, task: Task) -> Tuple[Worker, ...]:
+        """Workers that can accept the task, in fleet order"""
+        key = self.task_class(task)
+        feasible = self._feasible.get(key)
+        if feasible is None:
+            feasible = self._build_class(key)
+        return feasible
+
+    def positions_for(self, key: tuple) -> Tuple[int, ...]:
+        """Indices into the worker list of the workers feasible for a class"""
+        positions = self._positions.get(key)
+        if positions is None:
+            self._build_class(key)
+            positions = self._positions[key]
+        return positions
+
+    def position_set(self, key: tuple) -> FrozenSet[int]:
+        """Same as positions_for, as a set for O(1) membership tests"""
+        position_set = self._position_sets.get(key)
+        if position_set is None:
+            self._build_class(key)
+            position_set = self._position_sets[key]
+        return position_set
+
+    def classify(self, keys: Iterable[tuple]) -> Tuple[array, List[FrozenSet[int]]]:
+        """Class code per key, plus the feasible worker positions of each code"""
+        codes: Dict[tuple, int] = {}
+        row_class = array('i')
+        class_workers: List[FrozenSet[int]] = []
+        for key in keys:
+            code = codes.get(key)
+            if code is None:
+                code = codes[key] = len(class_workers)
+                class_workers.append(self.position_set(key))
+            row_class.append(code)
+        return row_class, class_workers
+
+    def invalidate(self):
+        """Drop every cached class, e.g. after a worker's regions or tier changed"""
+        self._feasible.clear()
+        self._positions.clear()
+        self._position_sets.clear()
+        self._signature = self._fleet_signature()
+
+    def refresh(self) -> bool:
+        """Invalidate if the fleet changed since the index was built"""
+        if self._fleet_signature() != self._signature:
+            self.invalidate()
+            return True
+        return False
+
+    def _build_class(self, key: tuple) -> Tuple[Worker, ...]:
+        positions = tuple(k for k, w in enumerate(self.workers) if w.accepts_class(*key))
+        if self.metrics is not None and self.metrics.enabled:
+            self.metrics.inc("eligibility.class_builds")
+            self.metrics.inc("eligibility.can_accept", len(self.workers))
+        feasible = tuple(self.workers[k] for k in positions)
+        self._feasible[key] = feasible
+        self._positions[key] = positions
+        self._position_sets[key] = frozenset(positions)
+        return feasible
+
+    def _fleet_signature(self) -> tuple:
+        return tuple((id(w), w.tier, w.regions, w.capacity) for w in self.workers)
@@ -1,3 +1,4 @@
+import sys
 from enum import Enum
 from datetime import datetime
 
@@ -18,19 +19,38 @@ class Resource(Enum):
     MEDIUM = 2
     HIGH = 3
 
+def to_minutes(moment) -> float:
+    """Minutes since the epoch for a datetime, +inf when the timestamp is missing"""
+    if moment is None:
+        return float('inf')
+    if isinstance(moment, datetime):
+        return moment.timestamp() / 60
+    return float(moment)
+
 class Task:
+    """A unit of work; `deadline` and `arrival` are its due date and arrival time
+    in minutes, computed once here so schedulers compare floats
+
+    Datetimes become minutes since the epoch and numbers are kept as given, which
+    the dynamic schedulers read as simulation minutes; `deadline_is_date` and
+    `arrival_is_date` tell the two apart.
+    """
+    __slots__ = ("name", "priority", "due_date", "deadline", "deadline_is_date", "region",
+                 "estimated_duration", "resource_requirements", "tier", "arrival_time", "arrival",
+                 "arrival_is_date", "completed")
+
     def __init__(self, name: str, priority: Priority, due_date: datetime, region: str, 
                  estimated_duration: float, resource_requirements: Resource, tier: Tier, 
                  arrival_time: float = 0,  # Time when task arrives in system
                  completed: bool = False):
         self.name = name
         self.priority = priority
-        self.due_date = due_date
-        self.region = region
+        self.set_due_date(due_date)
+        self.region = sys.intern(region)  # Shared by every task of the region
         self.estimated_duration = estimated_duration
         self.resource_requirements = resource_requirements
         self.tier = tier
-        self.arrival_time = arrival_time
+        self.set_arrival_time(arrival_time)
         self.completed = completed
     
     def set_priority(self, priority: Priority):
@@ -38,12 +58,16 @@ class Task:
     
     def set_due_date(self, due_date: datetime):
         self.due_date = due_date
+        self.deadline = to_minutes(due_date)
+        self.deadline_is_date = isinstance(due_date, datetime)
 
     def set_arrival_time(self, arrival_time: datetime):
         self.arrival_time = arrival_time
+        self.arrival = to_minutes(arrival_time)
+        self.arrival_is_date = isinstance(arrival_time, datetime)
     
     def set_region(self, region: str):
-        self.region = region
+        self.region = sys.intern(region)
     
     def set_estimated_duration(self, time: float):
         if time >= 0:
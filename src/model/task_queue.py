@@ -0,0 +1,70 @@
+from heapq import heappush, heappop
+from itertools import count
+from typing import Dict, Iterator, List, Optional
+from src.model.task import Task
+
+_REMOVED = object()
+
+class TaskQueue:
+    """Worker queue ordered by (-priority, deadline) with O(log n) push and pop
+
+    Removal marks the heap entry as dead instead of rebuilding the heap, so local
+    search can take arbitrary tasks out of a queue in O(1).
+    """
+    def __init__(self):
+        self._heap: List[list] = []
+        self._entries: Dict[Task, list] = {}
+        self._counter = count()
+
+    def push(self, task: Task):
+        if task in self._entries:
+            raise ValueError(f"Task {task.name} is already queued")
+        # The counter keeps insertion order among equal keys, like a stable sort
+        entry = [-task.priority.value, task.deadline, next(self._counter), task]
+        self._entries[task] = entry
+        heappush(self._heap, entry)
+
+    def popleft(self) -> Task:
+        self._discard_removed()
+        if not self._heap:
+            raise IndexError("pop from an empty task queue")
+        task = heappop(self._heap)[-1]
+        del self._entries[task]
+        return task
+
+    def peek(self) -> Optional[Task]:
+        self._discard_removed()
+        return self._heap[0][-1] if self._heap else None
+
+    def remove(self, task: Task):
+        entry = self._entries.pop(task, None)
+        if entry is None:
+            raise ValueError(f"Task {task.name} is not queued")
+        entry[-1] = _REMOVED
+        # Compact once dead entries dominate so the heap stays proportional to the queue
+        if len(self._heap) > 2 * len(self._entries) + 32:
+            self._heap = [e for e in self._heap if e[-1] is not _REMOVED]
+            self._heap.sort()
+
+    def clear(self):
+        self._heap = []
+        self._entries = {}
+
+    def _discard_removed(self):
+        heap = self._heap
+        while heap and heap[0][-1] is _REMOVED:
+            heappop(heap)
+
+    def __contains__(self, task: Task) -> bool:
+        return task in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __bool__(self) -> bool:
+        return bool(self._entries)
+
+    def __iter__(self) -> Iterator[Task]:
+        """Tasks in processing order"""
+        for entry in sorted(self._entries.values()):
+            yield entry[-1]
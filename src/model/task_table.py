@@ -0,0 +1,108 @@
+from array import array
+from datetime import datetime
+from typing import Dict, List, Optional
+from src.model.task import Task, Priority, Tier, Resource, to_minutes
+
+def from_minutes(minutes: float) -> Optional[datetime]:
+    if minutes == float('inf'):
+        return None
+    return datetime.fromtimestamp(minutes * 60)
+
+class TaskTable:
+    """Struct-of-arrays task list: one typed column per field, rows addressed by index
+
+    Times are float64 minutes since the epoch, enums are stored by value in int8
+    columns and regions are interned to small integer ids.
+    """
+    def __init__(self):
+        self.due = array('d')
+        self.arrival = array('d')
+        self.priority = array('b')
+        self.tier = array('b')
+        self.resource = array('b')
+        self.duration = array('f')
+        self.region = array('h')
+        self.row = array('l')
+        self.regions: List[str] = []
+        self.name_prefix = ""
+        self._region_ids: Dict[str, int] = {}
+        self._tasks: Optional[List[Task]] = None
+        self._materialized: Dict[int, Task] = {}
+
+    @classmethod
+    def from_tasks(cls, tasks: List[Task]) -> "TaskTable":
+        """Columnar copy of existing Task objects; task(i) returns the originals"""
+        table = cls()
+        for row, task in enumerate(tasks, 1):
+            table.append(task.deadline, task.arrival,
+                         task.priority.value, task.tier.value, task.resource_requirements.value,
+                         task.estimated_duration, task.region, row)
+        table._tasks = list(tasks)
+        return table
+
+    def intern_region(self, region: str) -> int:
+        region_id = self._region_ids.get(region)
+        if region_id is None:
+            region_id = len(self.regions)
+            self._region_ids[region] = region_id
+            self.regions.append(region)
+        return region_id
+
+    def append(self, due: float, arrival: float, priority: int, tier: int, resource: int,
+               duration: float, region: str, row: int):
+        self.due.append(due)
+        self.arrival.append(arrival)
+        self.priority.append(priority)
+        self.tier.append(tier)
+        self.resource.append(resource)
+        self.duration.append(duration)
+        self.region.append(self.intern_region(region))
+        self.row.append(row)
+
+    def __len__(self) -> int:
+        return len(self.row)
+
+    def name(self, i: int) -> str:
+        if self._tasks is not None:
+            return self._tasks[i].name
+        return f"{self.name_prefix}{self.row[i]}"
+
+    def class_key(self, i: int) -> tuple:
+        """Eligibility class of row i, as used by EligibilityIndex"""
+        return (self.regions[self.region[i]], self.tier[i], self.resource[i])
+
+    def sort_order(self) -> List[int]:
+        """Row indices by priority (HIGH first), then earliest deadline"""
+        priority, due = self.priority, self.due
+        return sorted(range(len(self)), key=lambda i: (-priority[i], due[i]))
+
+    def task(self, i: int) -> Task:
+        """Task object for row i, built once and then shared"""
+        if self._tasks is not None:
+            return self._tasks[i]
+        task = self._materialized.get(i)
+        if task is None:
+            task = Task(self.name(i), Priority(self.priority[i]), from_minutes(self.due[i]),
+                        self.regions[self.region[i]], float(self.duration[i]),
+                        Resource(self.resource[i]), Tier(self.tier[i]),
+                        from_minutes(self.arrival[i]))
+            self._materialized[i] = task
+        return task
+
+    def tasks(self) -> List[Task]:
+        return [self.task(i) for i in range(len(self))]
+
+    def __getstate__(self) -> dict:
+        # Columns mapped from a binary cache are memoryviews, which cannot be pickled
+        state = self.__dict__.copy()
+        for name, column in state.items():
+            if isinstance(column, memoryview):
+                state[name] = array(column.format, column)
+        return state
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the columns (excluding the region name table)"""
+        columns = (self.due, self.arrival, self.priority, self.tier,
+                   self.resource, self.duration, self.region, self.row)
+        return sum(column.itemsize * len(column) for column in columns)
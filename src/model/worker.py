@@ -1,22 +1,32 @@
-from typing import List, Optional
+import sys
+from typing import Dict, FrozenSet, Iterable, Optional
 from src.model.task import Tier, Task
+from src.model.task_queue import TaskQueue
+
+_region_sets: Dict[FrozenSet[str], FrozenSet[str]] = {}  # One shared instance per distinct set
 
 class Worker:
-    def __init__(self, name: str, tier: Tier, regions: List[str], capacity: int):
+    __slots__ = ("name", "tier", "regions", "capacity", "task_queue", "current_task", "current_load")
+
+    def __init__(self, name: str, tier: Tier, regions: Iterable[str], capacity: int):
         self.name = name
         self.tier = tier
-        self.regions = regions
+        regions = frozenset(sys.intern(region) for region in regions)
+        self.regions: FrozenSet[str] = _region_sets.setdefault(regions, regions)
         self.capacity = capacity
-        self.task_queue = []
+        self.task_queue = TaskQueue()
         self.current_task = None
         self.current_load = 0.0
 
     def can_accept(self, task: Task) -> bool:
-        if task.region not in self.regions:
+        return self.accepts_class(task.region, task.tier.value, task.resource_requirements.value)
+
+    def accepts_class(self, region: str, tier: int, resource: int) -> bool:
+        if region not in self.regions:
             return False
-        if task.tier.value > self.tier.value:
+        if tier > self.tier.value:
             return False
-        if self.capacity < task.resource_requirements.value:
+        if self.capacity < resource:
             return False
         return True
     
@@ -24,15 +34,14 @@ class Worker:
         if not self.can_accept(task):
             raise ValueError("Worker cannot accept this task")
         
-        self.task_queue.append(task)
+        self.task_queue.push(task)
         self.current_load += task.estimated_duration
-        self.task_queue.sort(key=lambda x: (-x.priority.value, x.due_date))
 
     def process_next_task(self) -> Optional[Task]:
         if not self.task_queue:
             return None
         
-        task = self.task_queue.pop(0)
+        task = self.task_queue.popleft()
         self.current_task = task
         return task
     
@@ -0,0 +1,112 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+from array import array
+from src.model.task import Task
+from src.model.task_table import TaskTable
+from src.model.worker import Worker
+
+UNASSIGNED = -1
+
+def materialize(workers: List[Worker], table: TaskTable, order: Sequence[int],
+                assignment: Sequence[int]) -> Dict[Worker, List[Task]]:
+    """Load a task-index -> worker-position assignment into the workers' queues"""
+    solution = {worker: [] for worker in workers}
+    for i in order:
+        position = assignment[i]
+        if position == UNASSIGNED:
+            continue
+        task = table.task(i)
+        worker = workers[position]
+        worker.add_task(task)
+        solution[worker].append(task)
+    return solution
+
+class Assignment:
+    """Candidate solution: worker position per task row plus per-worker loads
+
+    Task rows are shared and never copied; a candidate only owns these two
+    arrays, so building and discarding one per GRASP iteration is cheap. While
+    a journal is open every move is recorded, so a trial sequence of moves can
+    be undone with rollback() instead of copying the candidate first.
+    """
+    def __init__(self, durations: Sequence[float], n_workers: int):
+        self.durations = durations
+        self.worker_of = array('i', [UNASSIGNED]) * len(durations)
+        self.loads = [0.0] * n_workers
+        self.journal: Optional[List[Tuple[int, int]]] = None
+
+    @classmethod
+    def from_array(cls, durations: Sequence[float], n_workers: int,
+                   worker_of: Sequence[int]) -> "Assignment":
+        """Candidate for an existing worker-position array, with loads recomputed"""
+        candidate = cls(durations, n_workers)
+        candidate.worker_of = array('i', worker_of)
+        for i, position in enumerate(candidate.worker_of):
+            if position != UNASSIGNED:
+                candidate.loads[position] += durations[i]
+        return candidate
+
+    def assign(self, i: int, position: int):
+        """Put row i on a worker, or take it off with UNASSIGNED"""
+        current = self.worker_of[i]
+        if current == position:
+            return
+        if self.journal is not None:
+            self.journal.append((i, current))
+        self._move(i, current, position)
+
+    def checkpoint(self) -> int:
+        """Start recording moves if needed and return a mark to roll back to"""
+        if self.journal is None:
+            self.journal = []
+        return len(self.journal)
+
+    def rollback(self, mark: int):
+        """Undo every move recorded after the mark"""
+        journal = self.journal
+        while len(journal) > mark:
+            i, position = journal.pop()
+            self._move(i, self.worker_of[i], position)
+
+    def close_journal(self):
+        self.journal = None
+
+    def _move(self, i: int, current: int, position: int):
+        duration = self.durations[i]
+        if current != UNASSIGNED:
+            self.loads[current] -= duration
+        if position != UNASSIGNED:
+            self.loads[position] += duration
+        self.worker_of[i] = position
+
+    def members(self, order: Sequence[int]) -> List[List[int]]:
+        """Rows assigned to each worker, in processing order"""
+        members = [[] for _ in self.loads]
+        worker_of = self.worker_of
+        for i in order:
+            position = worker_of[i]
+            if position != UNASSIGNED:
+                members[position].append(i)
+        return members
+
+    def copy(self) -> "Assignment":
+        clone = Assignment.__new__(Assignment)
+        clone.durations = self.durations
+        clone.worker_of = array('i', self.worker_of)
+        clone.loads = list(self.loads)
+        clone.journal = None
+        return clone
+
+    @classmethod
+    def from_solution(cls, workers: List[Worker],
+                      solution: Dict[Worker, List[Task]]) -> Tuple[TaskTable, "Assignment"]:
+        """Columnar table and assignment equivalent to a materialized solution"""
+        positions = {worker: k for k, worker in enumerate(workers)}
+        tasks = [task for worker in solution for task in solution[worker]]
+        table = TaskTable.from_tasks(tasks)
+        assignment = cls(table.duration, len(workers))
+        i = 0
+        for worker, assigned in solution.items():
+            for _ in assigned:
+                assignment.assign(i, positions[worker])
+                i += 1
+        return table, assignment
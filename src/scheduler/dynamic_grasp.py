@@ -1,69 +1,75 @@
-from enum import Enum
 import random
-from typing import List, Optional
-from datetime import datetime
-import copy
+from typing import List, Optional, Set, Union
 from src.model.task import Task
 from src.model.worker import Worker
-from heapq import heappush, heappop
+from src.scheduler.assignment import Assignment
+from src.scheduler.local_search import LocalSearch
+from src.scheduler.event_log import EventSink
+from src.scheduler.metrics import Metrics
+from src.scheduler.reactive import ReactiveAlpha
+from src.scheduler.simulation import Event, EventDrivenScheduler, EventType
+from heapq import heappush
 
-class EventType(Enum):
-    TASK_ARRIVAL = 1
-    TASK_COMPLETION = 2
+class _WorkerSnapshot:
+    """The part of an idle worker a plan changes: its load, with a link back to the worker"""
+    __slots__ = ("worker", "position", "current_load")
 
-class Event:
-    def __init__(self, event_type: EventType, time: float, task: Optional[Task] = None):
-        self.event_type = event_type
-        self.time = time  # Simulation time in minutes
-        self.task = task
-    
-    def __lt__(self, other):
-        return self.time < other.time
+    def __init__(self, worker: Worker, position: int):
+        self.worker = worker
+        self.position = position  # Index in the fleet
+        self.current_load = worker.current_load
 
-class DynamicGRASPScheduler:
-    def __init__(self, workers: List[Worker], alpha: float = 0.3):
-        self.workers = workers
-        self.alpha = alpha  # GRASP randomness parameter
-        self.event_queue = []
-        self.current_time = 0  # Minutes
-        self.pending_tasks = []
-        self.time_offset = 0  # For normalizing past timestamps
-        self.simulation_started = False
-    
     def add_task(self, task: Task):
-        """Add task with proper time normalization"""
-        if not isinstance(task.arrival_time, (float, int)):
-            # Convert datetime arrival_time to minutes since epoch
-            arrival_epoch = task.arrival_time.timestamp() / 60
-            
-            if not self.simulation_started:
-                # Set time offset based on earliest task
-                self.time_offset = -arrival_epoch
-                self.simulation_started = True
-            
-            task.arrival_time = arrival_epoch + self.time_offset
-        
-        heappush(self.event_queue, Event(EventType.TASK_ARRIVAL, task.arrival_time, task))
+        self.current_load += task.estimated_duration
+
+class DynamicGRASPScheduler(EventDrivenScheduler):
+    def __init__(self, workers: List[Worker], alpha: Union[float, ReactiveAlpha] = 0.3,
+                 events: Optional[EventSink] = None, metrics: Optional[Metrics] = None,
+                 iterations: int = 3, incremental: bool = False, coalesce_window: Optional[float] = 0.0,
+                 min_run_interval: float = 0.0, verbose: bool = False):
+        super().__init__(workers, events, metrics, coalesce_window, verbose)
+        self.min_run_interval = min_run_interval  # Minutes between GRASP runs; later triggers wait for a replan event
+        self.alpha = alpha  # GRASP randomness parameter, or a ReactiveAlpha that learns it
+        self.iterations = iterations  # Constructions per scheduler run
+        self.incremental = incremental  # Re-plan only what changed since the last run
+        self._stale_classes: Set[tuple] = set()  # Classes with a new task or a newly idle worker since the last run
+        self._last_run = float('-inf')
+        self._replan_queued = False
     
-    def run_simulation(self, end_time_minutes: float = 8*60):
-        """Run simulation with proper task processing"""
-        print(f"\nStarting GRASP simulation (α={self.alpha})")
-        
-        while self.event_queue and self.current_time <= end_time_minutes:
-            event = heappop(self.event_queue)
-            self.current_time = event.time
-            
-            if event.event_type == EventType.TASK_ARRIVAL:
-                self._handle_task_arrival(event.task)
-            elif event.event_type == EventType.TASK_COMPLETION:
-                self._handle_task_completion(event.task)
-            
-            # Only run scheduler when workers are idle
-            if any(w.current_task is None for w in self.workers):
-                self._run_grasp_scheduler()
-        
-        # Final cleanup
+    @property
+    def pending_tasks(self) -> List[Task]:
+        """Unassigned tasks in arrival order"""
+        return list(self.pending)
+
+    def _start_message(self) -> str:
+        return f"\nStarting GRASP simulation (α={self.alpha})"
+
+    def _fleet_changed(self):
+        self._stale_classes.update(self.pending.classes())
+
+    def _admit(self, task: Task):
+        self._stale_classes.add(self.pending.add(task))
+
+    def _task_finished(self, worker: Worker):
+        if worker.current_task is None:
+            self._stale_classes.update(self.pending.classes_of(self._positions[worker]))
+
+    def _handle_replan(self):
+        self._replan_queued = False
+
+    def _schedule(self):
+        # Only run scheduler when workers are idle, and when incremental only if something changed
+        if (self._stale_classes or not self.incremental) and any(w.current_task is None for w in self.workers):
+            if self.current_time < self._last_run + self.min_run_interval:
+                self._queue_replan()
+            else:
+                with self.metrics.timer("invocation_latency"):
+                    self._run_grasp_scheduler()
+
+    def _finish(self):
         self._complete_remaining_tasks()
+
+    def _print_report(self):
         print(f"\nSimulation completed at {self._format_time(self.current_time)}")
         self._print_final_stats()
 
@@ -83,67 +89,100 @@ class DynamicGRASPScheduler:
             
             if next_worker:
                 self.current_time = next_time
+                task = next_worker.current_task
+                self.completion_times[task.name] = next_time
                 next_worker.complete_current_task()
-                print(f"[{self._format_time(self.current_time)}] {next_worker.name} "
-                      f"completed task")
+                del self.task_workers[task]
+                self.events.emit("task_completed", self.current_time, worker=next_worker.name,
+                                 task=task.name, priority=task.priority.name)
                 self._assign_next_task(next_worker)
 
-    def _handle_task_arrival(self, task: Task):
-        """Process new task arrival"""
-        self.pending_tasks.append(task)
-        print(f"[{self._format_time(self.current_time)}] Task '{task.name}' arrived")
-
-    def _handle_task_completion(self, task: Task):
-        """Process task completion and start next task"""
-        for worker in self.workers:
-            if worker.current_task == task:
-                worker.complete_current_task()
-                worker.current_load -= task.estimated_duration
-                print(f"[{self._format_time(self.current_time)}] {worker.name} "
-                      f"completed '{task.name}'")
-                self._assign_next_task(worker)
-                break
-
     def _run_grasp_scheduler(self):
-        """GRASP scheduling for idle workers"""
-        if not self.pending_tasks:
+        """GRASP scheduling for idle workers
+
+        A plan is committed as soon as it is applied, and it places every task
+        some idle worker can take. So after a run, only new arrivals and workers
+        that have gone idle since can give a task somewhere to go. In
+        incremental mode a run covers just those classes and the idle workers
+        that serve them, and it is skipped when nothing changed. The full mode
+        re-plans every class an idle worker can take.
+        """
+        stale, self._stale_classes = self._stale_classes, set()
+        if not self.pending or (self.incremental and not stale):
             return
+        self._last_run = self.current_time
         
-        print(f"[{self._format_time(self.current_time)}] Running scheduler...")
+        self.events.emit("scheduler_run", self.current_time, pending=len(self.pending))
         
+        if self.incremental:
+            keys = stale
+            positions = sorted({k for key in stale for k in self.eligibility.positions_for(key)
+                                if self.workers[k].current_task is None})
+        else:
+            # Only classes an idle worker can take have anything to place
+            positions = [k for k, w in enumerate(self.workers) if w.current_task is None]
+            keys = {key for k in positions for key in self.pending.classes_of(k)}
+        tasks = self.pending.ordered(keys)
         best_solution = None
         best_score = float('-inf')
+        tried = []  # (alpha, score) per iteration, for a reactive alpha
         
+        metrics = self.metrics
         # Limited iterations for dynamic environment
-        for _ in range(3):
-            solution = self._construct_grasp_solution()
-            solution = self._local_search(solution)
-            current_score = self._evaluate_solution(solution)
+        for _ in range(self.iterations):
+            alpha = self.alpha.sample(random) if isinstance(self.alpha, ReactiveAlpha) else self.alpha
+            with metrics.timer("grasp.construct"):
+                solution = self._construct_grasp_solution(alpha, tasks, positions)
+            with metrics.timer("grasp.local_search"):
+                solution = self._local_search(solution)
+            with metrics.timer("grasp.evaluate"):
+                current_score = self._evaluate_solution(solution)
+            metrics.inc("grasp.iterations")
+            tried.append((alpha, current_score))
             
             if current_score > best_score:
                 best_score = current_score
                 best_solution = solution
         
+        if isinstance(self.alpha, ReactiveAlpha):
+            self._record_alphas(tried)
         if best_solution:
-            self._apply_solution(best_solution)
+            with metrics.timer("grasp.apply"):
+                self._apply_solution(best_solution)
+
+    def _record_alphas(self, tried: List[tuple]):
+        """Feed a run's scores to the reactive alpha, rescaled to [0, 1] within the run
+
+        Each run plans a different backlog, so raw scores from different runs
+        are on unrelated scales; the rescale keeps each run's ranking of its
+        alphas and makes runs comparable.
+        """
+        scores = [score for _, score in tried]
+        worst = min(scores)
+        spread = max(scores) - worst
+        for alpha, score in tried:
+            self.alpha.record(alpha, (score - worst) / spread if spread > 0 else 1.0)
+
+    def _construct_grasp_solution(self, alpha: float, tasks: List[Task], positions: List[int]):
+        """Greedy randomized construction over tasks already in dispatch order
 
-    def _construct_grasp_solution(self):
-        """Greedy randomized construction"""
-        temp_workers = copy.deepcopy([w for w in self.workers if w.current_task is None])
-        solution = {w: [] for w in temp_workers}
+        Plans on snapshots of the idle workers at these fleet positions; the
+        workers themselves are only touched when the best plan is applied.
+        """
+        temp_of = {k: _WorkerSnapshot(self.workers[k], k) for k in positions}
+        solution = {w: [] for w in temp_of.values()}
         
-        for task in sorted(self.pending_tasks,
-                         key=lambda x: (-x.priority.value, x.due_date.timestamp() 
-                                      if isinstance(x.due_date, datetime) 
-                                      else x.due_date)):
-            feasible_workers = [w for w in temp_workers if w.can_accept(task)]
+        for task in tasks:
+            key = self.eligibility.task_class(task)
+            feasible_workers = [temp_of[k] for k in self.eligibility.positions_for(key) if k in temp_of]
             
             if not feasible_workers:
                 continue
             
+            deadline = self.deadline_minutes(task)
             worker_scores = []
             for worker in feasible_workers:
-                slack = self._calculate_slack(worker, task)
+                slack = deadline - (self.current_time + worker.current_load)
                 score = worker.current_load - (0.5 * slack)
                 worker_scores.append((score, worker))
             
@@ -151,7 +190,7 @@ class DynamicGRASPScheduler:
             worker_scores.sort(key=lambda x: x[0])
             min_score = worker_scores[0][0]
             max_score = worker_scores[-1][0]
-            threshold = min_score + self.alpha * (max_score - min_score)
+            threshold = min_score + alpha * (max_score - min_score)
             rcl = [ws[1] for ws in worker_scores if ws[0] <= threshold]
             
             if rcl:
@@ -161,52 +200,27 @@ class DynamicGRASPScheduler:
         
         return solution
     
-    def _calculate_slack(self, worker: Worker, task: Task) -> float:
-        """Calculate time slack before deadline"""
-        if isinstance(task.due_date, datetime):
-            deadline_min = (task.due_date.timestamp() / 60) + self.time_offset
-        else:
-            deadline_min = task.due_date
-        
-        return deadline_min - (self.current_time + worker.current_load)
-
     def _local_search(self, solution):
-        """Simple swap-based local search"""
-        improved = True
-        max_iterations = 10
-        
-        while improved and max_iterations > 0:
-            improved = False
-            max_iterations -= 1
-            
-            for worker1, tasks1 in solution.items():
-                for worker2, tasks2 in solution.items():
-                    if worker1 == worker2:
-                        continue
-                    
-                    # Try all possible swaps between workers
-                    for i, task1 in enumerate(tasks1):
-                        for j, task2 in enumerate(tasks2):
-                            if (worker1.can_accept(task2) and 
-                                worker2.can_accept(task1) and
-                                self._swap_improves(worker1, task1, worker2, task2)):
-                                
-                                # Perform swap
-                                tasks1[i], tasks2[j] = tasks2[j], tasks1[i]
-                                worker1.task_queue.remove(task1)
-                                worker2.task_queue.remove(task2)
-                                worker1.add_task(task2)
-                                worker2.add_task(task1)
-                                improved = True
-                                break
-                        if improved:
-                            break
-                    if improved:
-                        break
-                if improved:
-                    break
-        
-        return solution
+        """Relocate/swap descent between the temporary workers"""
+        temp_workers = list(solution)
+        table, candidate = Assignment.from_solution(temp_workers, solution)
+        if not len(table):
+            return solution
+
+        # Loads include whatever the workers already had before this plan
+        candidate.loads = [w.current_load for w in temp_workers]
+        local_positions = {w.position: p for p, w in enumerate(temp_workers)}
+        row_class, class_workers = self.eligibility.classify(table.class_key(i) for i in range(len(table)))
+        class_workers = [frozenset(local_positions[k] for k in positions if k in local_positions)
+                         for positions in class_workers]
+        LocalSearch(row_class, class_workers, metrics=self.metrics).run(candidate)
+
+        improved = {w: [] for w in temp_workers}
+        for i in table.sort_order():
+            improved[temp_workers[candidate.worker_of[i]]].append(table.task(i))
+        for p, worker in enumerate(temp_workers):
+            worker.current_load = candidate.loads[p]
+        return improved
 
     def _evaluate_solution(self, solution) -> float:
         """Evaluate solution quality"""
@@ -226,12 +240,7 @@ class DynamicGRASPScheduler:
         for worker, tasks in solution.items():
             completion_time = self.current_time + worker.current_load
             for task in tasks:
-                if isinstance(task.due_date, datetime):
-                    deadline_min = (task.due_date.timestamp() / 60) + self.time_offset
-                else:
-                    deadline_min = task.due_date
-                
-                if completion_time <= deadline_min:
+                if completion_time <= self.deadline_minutes(task):
                     deadline_score += 1
                 completion_time += task.estimated_duration
         
@@ -240,52 +249,30 @@ class DynamicGRASPScheduler:
 
     def _apply_solution(self, solution):
         """Apply the best found solution"""
-        for worker, tasks in solution.items():
-            real_worker = next(w for w in self.workers if w.name == worker.name)
+        for snapshot, tasks in solution.items():
+            real_worker = snapshot.worker
             
             # Clear current queue (except running task)
             if real_worker.current_task is None:
-                real_worker.task_queue = []
+                real_worker.task_queue.clear()
                 real_worker.current_load = 0
             
             # Add new assignments
             for task in tasks:
                 if task not in real_worker.task_queue:
                     real_worker.add_task(task)
+                    self.task_workers[task] = real_worker
+                self.pending.remove(task)
             
             # Start processing if idle
             if real_worker.current_task is None and real_worker.task_queue:
                 self._assign_next_task(real_worker)
-        
-        # Update pending tasks
-        self.pending_tasks = [t for t in self.pending_tasks 
-                             if not any(t in w.task_queue for w in self.workers)]
-
-    def _assign_next_task(self, worker: Worker):
-        """Start next task on worker if available"""
-        if worker.task_queue and worker.current_task is None:
-            next_task = worker.process_next_task()
-            completion_time = self.current_time + next_task.estimated_duration
-            heappush(self.event_queue,
-                   Event(EventType.TASK_COMPLETION, completion_time, next_task))
-            print(f"[{self._format_time(self.current_time)}] {worker.name} "
-                  f"started '{next_task.name}' "
-                  f"(ETA: {self._format_time(completion_time)})")
-
-    def _swap_improves(self, worker1, task1, worker2, task2) -> bool:
-        """Check if swapping tasks improves solution"""
-        # Calculate current and new loads
-        current_diff = abs(worker1.current_load - worker2.current_load)
-        
-        new_load1 = worker1.current_load - task1.estimated_duration + task2.estimated_duration
-        new_load2 = worker2.current_load - task2.estimated_duration + task1.estimated_duration
-        new_diff = abs(new_load1 - new_load2)
-        
-        return new_diff < current_diff
 
-    def _format_time(self, minutes: float) -> str:
-        """Convert minutes to HH:MM format"""
-        return f"{int(minutes//60):02d}:{int(minutes%60):02d}"
+    def _queue_replan(self):
+        """Make sure the event loop wakes up once min_run_interval has passed since the last run"""
+        if not self._replan_queued:
+            self._replan_queued = True
+            heappush(self.event_queue, Event(EventType.REPLAN, self._last_run + self.min_run_interval))
 
     def _print_final_stats(self):
         """Print simulation summary"""
@@ -301,6 +288,6 @@ class DynamicGRASPScheduler:
             if worker.current_task:
                 print(f"  - Current task: {worker.current_task.name}")
         
-        print("\nPending Tasks:", len(self.pending_tasks))
-        for task in self.pending_tasks:
+        print("\nPending Tasks:", len(self.pending))
+        for task in self.pending:
             print(f"- '{task.name}' (Tier: {task.tier.name}, Resources: {task.resource_requirements.name})")
\ No newline at end of file
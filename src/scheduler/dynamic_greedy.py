@@ -1,145 +1,96 @@
-from typing import List, Optional
-from enum import Enum
-from heapq import heappush, heappop
+from typing import Dict, List, Optional
 from src.model.task import Task
 from src.model.worker import Worker
-from datetime import datetime
-
-class EventType(Enum):
-    TASK_ARRIVAL = 1
-    TASK_COMPLETION = 2
-
-class Event:
-    def __init__(self, event_type: EventType, time: float, task: Optional[Task] = None):
-        self.event_type = event_type
-        self.time = time
-        self.task = task
-    
-    def __lt__(self, other):
-        return self.time < other.time
-
-class DynamicGREEDYScheduler:
-    def __init__(self, workers: List[Worker]):
-        self.workers = workers
-        self.event_queue = []
-        self.current_time = 0  # Simulation time in minutes
-        self.pending_tasks = []
-        self.time_offset = 0  # For normalizing past timestamps
-        self.simulation_started = False
-    
-    def add_task(self, task: Task):
-        """Add task with proper time normalization"""
-        if not isinstance(task.arrival_time, (float, int)):
-            # Convert datetime arrival_time to minutes since epoch
-            arrival_epoch = task.arrival_time.timestamp() / 60
-            
-            if not self.simulation_started:
-                # Set time offset based on earliest task
-                self.time_offset = -arrival_epoch
-                self.simulation_started = True
-            
-            task.arrival_time = arrival_epoch + self.time_offset
-        
-        heappush(self.event_queue, Event(EventType.TASK_ARRIVAL, task.arrival_time, task))
-    
-    def run_simulation(self, end_time_minutes: float = 8*60):
-        """Run simulation for specified duration (default 8 hours)"""
-        print(f"\nStarting simulation (current offset: {self._format_time(self.time_offset*60)})")
-        
-        while self.event_queue and self.current_time <= end_time_minutes:
-            event = heappop(self.event_queue)
-            self.current_time = event.time
-            
-            if event.event_type == EventType.TASK_ARRIVAL:
-                self._handle_task_arrival(event.task)
-            elif event.event_type == EventType.TASK_COMPLETION:
-                self._handle_task_completion(event.task)
-            
+from src.scheduler.event_log import EventSink
+from src.scheduler.metrics import Metrics
+from src.scheduler.simulation import Event, EventDrivenScheduler, EventType
+
+__all__ = ["DynamicGREEDYScheduler", "Event", "EventType"]
+
+class DynamicGREEDYScheduler(EventDrivenScheduler):
+    def __init__(self, workers: List[Worker], events: Optional[EventSink] = None,
+                 metrics: Optional[Metrics] = None, coalesce_window: Optional[float] = 0.0,
+                 verbose: bool = False):
+        super().__init__(workers, events, metrics, coalesce_window, verbose)
+        self._arrived = []  # Pending entries of tasks that arrived since the last pass
+        self._lightened: Dict[tuple, float] = {}  # Class -> lowest load of its workers that finished a task since
+
+    @property
+    def pending_tasks(self) -> List[Task]:
+        """Unassigned tasks in dispatch order"""
+        return self.pending.ordered()
+
+    def _start_message(self) -> str:
+        return f"\nStarting simulation (current offset: {self._format_time(self.time_offset*60)})"
+
+    def _fleet_changed(self):
+        self._lightened = dict.fromkeys(self.pending.classes(), float('-inf'))
+
+    def _admit(self, task: Task):
+        self._arrived.append(self.pending.admit(task))
+
+    def _task_finished(self, worker: Worker):
+        # A lighter worker may now fit waiting tasks of any class it serves
+        lightened = self._lightened
+        for key in self.pending.classes_of(self._positions[worker]):
+            if lightened.get(key, worker.current_load) >= worker.current_load:
+                lightened[key] = worker.current_load
+
+    def _schedule(self):
+        with self.metrics.timer("invocation_latency"):
             self._schedule_pending_tasks()
-        
+
+    def _print_report(self):
         print(f"\nSimulation ended at {self._format_time(self.current_time)}")
         self._print_final_stats()
 
-    def _handle_task_arrival(self, task: Task):
-        """Process new task arrival"""
-        self.pending_tasks.append(task)
-        print(f"[{self._format_time(self.current_time)}] Task '{task.name}' arrived | "
-              f"Priority: {task.priority.name} | "
-              f"Duration: {task.estimated_duration} mins | "
-              f"Tier: {task.tier.name} | "
-              f"Resources: {task.resource_requirements.name}")
-
-    def _handle_task_completion(self, task: Task):
-        """Process task completion"""
-        for worker in self.workers:
-            if worker.current_task == task:
-                worker.complete_current_task()
-                worker.current_load -= task.estimated_duration
-                print(f"[{self._format_time(self.current_time)}] {worker.name} "
-                      f"completed '{task.name}' (was {task.priority.name} priority)")
-                self._assign_next_task(worker)
-                break
-
     def _schedule_pending_tasks(self):
-        """Assign tasks using greedy approach with new tier/resource logic"""
-        # Sort by priority (HIGH first), then earliest deadline
-        self.pending_tasks.sort(key=lambda x: (
-            -x.priority.value,
-            x.due_date.timestamp() if isinstance(x.due_date, datetime) else x.due_date
-        ))
-        
-        for task in self.pending_tasks[:]:
+        """Assign tasks using greedy approach with new tier/resource logic
+
+        Loads only drop when a task finishes and the clock only moves forward,
+        so a task that fit no worker at the last pass can only fit now on a
+        worker that finished something since. Besides new arrivals, a pass only
+        tries the waiting tasks such a worker could still finish in time.
+        """
+        if not self._arrived and not self._lightened:
+            return
+        candidates = self._arrived
+        for key, load in self._lightened.items():
+            candidates.extend(self.pending.pop_startable(key, self.current_time + load))
+        self._arrived = []
+        self._lightened = {}
+        # Priority (HIGH first), then earliest deadline, as one pass over all pending tasks would
+        candidates.sort(key=lambda entry: self.pending.dispatch_order(entry[2]))
+
+        for entry in candidates:
+            task = entry[2]
+            now, duration, deadline = self.current_time, task.estimated_duration, self.deadline_minutes(task)
             feasible_workers = [
-                w for w in self.workers 
-                if w.can_accept(task) and 
-                self._can_complete_on_time(w, task)
+                w for w in self.eligibility.feasible_workers(task)
+                if now + w.current_load + duration <= deadline
             ]
-            
+
             if not feasible_workers:
+                self.pending.restore(entry)
                 continue
-                
+
             # Select worker with minimum current load
             selected_worker = min(feasible_workers, key=lambda w: w.current_load)
             selected_worker.add_task(task)
-            self.pending_tasks.remove(task)
-            
-            print(f"[{self._format_time(self.current_time)}] Assigned '{task.name}' "
-                  f"to {selected_worker.name} (Tier {selected_worker.tier.name})")
-            
+            self.task_workers[task] = selected_worker
+            self.pending.remove(task)
+
+            self.events.emit("task_assigned", self.current_time, task=task.name,
+                             worker=selected_worker.name, worker_tier=selected_worker.tier.name)
+
             if selected_worker.current_task is None:
                 self._assign_next_task(selected_worker)
 
-    def _assign_next_task(self, worker: Worker):
-        """Start processing next task on worker"""
-        if worker.task_queue and worker.current_task is None:
-            next_task = worker.process_next_task()
-            completion_time = self.current_time + next_task.estimated_duration
-            heappush(self.event_queue,
-                   Event(EventType.TASK_COMPLETION, completion_time, next_task))
-            
-            print(f"[{self._format_time(self.current_time)}] {worker.name} "
-                  f"started '{next_task.name}' "
-                  f"(ETA: {self._format_time(completion_time)})")
-
-    def _can_complete_on_time(self, worker: Worker, task: Task) -> bool:
-        """Check if task can be completed before deadline"""
-        if isinstance(task.due_date, datetime):
-            deadline_min = (task.due_date.timestamp() / 60) + self.time_offset
-        else:
-            deadline_min = task.due_date
-            
-        estimated_end = self.current_time + worker.current_load + task.estimated_duration
-        return estimated_end <= deadline_min
-
-    def _format_time(self, minutes: float) -> str:
-        """Convert minutes to HH:MM format"""
-        return f"{int(minutes//60):02d}:{int(minutes%60):02d}"
-
     def _print_final_stats(self):
         """Print simulation summary"""
         print("\n=== Final Statistics ===")
         print(f"Total simulation time: {self._format_time(self.current_time)}")
-        
+
         print("\nWorker Utilization:")
         for worker in self.workers:
             utilization = (worker.current_load / self.current_time) * 100 if self.current_time > 0 else 0
@@ -149,15 +100,15 @@ class DynamicGREEDYScheduler:
             print(f"  - Pending tasks: {pending}")
             if worker.current_task:
                 print(f"  - Current task: {worker.current_task.name}")
-        
-        print("\nPending Tasks:", len(self.pending_tasks))
+
+        print("\nPending Tasks:", len(self.pending))
         for task in self.pending_tasks:
-            deadline = self._format_deadline(task.due_date)
+            deadline = self._format_deadline(task)
             print(f"- '{task.name}' (Due: {deadline}, Tier: {task.tier.name})")
 
-    def _format_deadline(self, due_date) -> str:
+    def _format_deadline(self, task: Task) -> str:
         """Format deadline for display"""
-        if isinstance(due_date, datetime):
-            deadline_min = (due_date.timestamp() / 60) + self.time_offset
-            return f"{self._format_time(deadline_min)} (original: {due_date.strftime('%Y-%m-%d %H:%M')})"
-        return f"{self._format_time(due_date)}"
\ No newline at end of file
+        deadline_min = self.deadline_minutes(task)
+        if task.deadline_is_date:
+            return f"{self._format_time(deadline_min)} (original: {task.due_date.strftime('%Y-%m-%d %H:%M')})"
+        return f"{self._format_time(deadline_min)}"
@@ -0,0 +1,113 @@
+from bisect import bisect_left, insort
+from operator import ne
+from typing import Dict, List, Optional, Tuple
+from src.scheduler.assignment import UNASSIGNED, Assignment
+from src.scheduler.evaluation import DUE_DATE_PENALTY, SolutionEvaluator
+
+def distance(first: Assignment, second: Assignment) -> int:
+    """Number of task rows the two assignments put on different workers"""
+    return sum(map(ne, first.worker_of, second.worker_of))
+
+class ElitePool:
+    """Best assignments seen so far, kept apart by a minimum share of differing rows"""
+    def __init__(self, size: int, min_difference: float = 0.05):
+        self.size = size
+        self.min_difference = min_difference
+        self.members: List[Tuple[float, Assignment]] = []
+
+    def add(self, score: float, candidate: Assignment) -> bool:
+        """Admit a candidate if it is a new best, or good and different enough"""
+        if self.size <= 0:
+            return False
+        distances = [distance(candidate, member) for _, member in self.members]
+        if 0 in distances:
+            return False
+
+        new_best = not self.members or score > max(s for s, _ in self.members)
+        diverse = all(d >= self.min_difference * len(candidate.worker_of) for d in distances)
+        if len(self.members) < self.size:
+            if new_best or diverse:
+                self.members.append((score, candidate.copy()))
+                return True
+            return False
+
+        if not new_best and (not diverse or score <= min(s for s, _ in self.members)):
+            return False
+        # Replace the most similar member among those the candidate beats
+        worse = [k for k, (s, _) in enumerate(self.members) if s <= score]
+        if not worse:
+            return False
+        replaced = min(worse, key=lambda k: distances[k])
+        self.members[replaced] = (score, candidate.copy())
+        return True
+
+    def guide_for(self, candidate: Assignment) -> Optional[Assignment]:
+        """The elite member most different from the candidate"""
+        best, best_distance = None, 0
+        for _, member in self.members:
+            d = distance(candidate, member)
+            if d > best_distance:
+                best, best_distance = member, d
+        return best
+
+def path_relink(start: Assignment, guide: Assignment,
+                evaluator: SolutionEvaluator) -> Optional[Tuple[float, Assignment]]:
+    """Best intermediate assignment on a greedy path from start toward guide
+
+    Each step moves one differing row to the guide's worker, picking the move
+    that lowers the sum of squared loads the most. Only the two workers touched
+    by a step are rescored, and the walk is undone back to the best
+    intermediate through the assignment journal. Returns None if the two
+    assignments are too close to have intermediates.
+    """
+    current = start.copy()
+    guide_of = guide.worker_of
+    durations = current.durations
+    rank = evaluator.rank
+
+    # Differing rows grouped by (from, to, duration); a group's rows are interchangeable
+    groups: Dict[tuple, List[int]] = {}
+    steps = 0
+    for i, position in enumerate(current.worker_of):
+        if position != guide_of[i]:
+            groups.setdefault((position, guide_of[i], durations[i]), []).append(i)
+            steps += 1
+    if steps < 2:
+        return None
+
+    ranks = [[] for _ in current.loads]
+    for i, position in enumerate(current.worker_of):
+        if position != UNASSIGNED:
+            ranks[position].append(rank[i])
+    for worker_ranks in ranks:
+        worker_ranks.sort()
+    order = evaluator.order
+    misses = [evaluator.deadline_misses([order[r] for r in worker_ranks]) for worker_ranks in ranks]
+    priority_total = sum(evaluator.priorities[i] for i, position in enumerate(current.worker_of)
+                         if position != UNASSIGNED)
+
+    loads = current.loads
+    mark = current.checkpoint()
+    best_score, best_mark = float('-inf'), mark
+    # Stop one step short of the guide, which is already a known solution
+    for _ in range(steps - 1):
+        key = min(groups, key=lambda g: g[2] * (loads[g[1]] - loads[g[0]] + g[2]))
+        source, target, _ = key
+        rows = groups[key]
+        i = rows.pop()
+        if not rows:
+            del groups[key]
+
+        current.assign(i, target)
+        del ranks[source][bisect_left(ranks[source], rank[i])]
+        insort(ranks[target], rank[i])
+        for position in (source, target):
+            misses[position] = evaluator.deadline_misses([order[r] for r in ranks[position]])
+
+        score = -max(loads) - priority_total - DUE_DATE_PENALTY * sum(misses)
+        if score > best_score:
+            best_score, best_mark = score, len(current.journal)
+
+    current.rollback(best_mark)
+    current.close_journal()
+    return best_score, current
@@ -0,0 +1,41 @@
+from array import array
+from datetime import datetime
+from itertools import accumulate
+from operator import gt
+from typing import List, Optional, Sequence
+from src.model.task_table import TaskTable, to_minutes
+from src.scheduler.assignment import Assignment
+
+DUE_DATE_PENALTY = 100
+
+class SolutionEvaluator:
+    """Scores assignments of one task table against a single reference time
+
+    The time left until each deadline is computed once, so scoring a candidate is
+    a prefix sum over each worker's queue durations compared with those limits.
+    """
+    def __init__(self, table: TaskTable, order: Sequence[int], now: Optional[float] = None):
+        self.now = to_minutes(datetime.now()) if now is None else now
+        self.order = order
+        self.durations = table.duration
+        self.priorities = table.priority
+        self.time_left = array('d', [due - self.now for due in table.due])
+        self.rank = array('i', [0]) * len(table)  # Position of each row in processing order
+        for position, i in enumerate(order):
+            self.rank[i] = position
+
+    def score(self, candidate: Assignment) -> float:
+        """-makespan - sum of priority values - 100 per task finishing after its deadline"""
+        misses = 0
+        priority_total = 0
+        for rows in candidate.members(self.order):
+            if rows:
+                misses += self.deadline_misses(rows)
+                priority_total += sum(map(self.priorities.__getitem__, rows))
+        makespan = max(candidate.loads) if candidate.loads else 0.0
+        return -makespan - priority_total - DUE_DATE_PENALTY * misses
+
+    def deadline_misses(self, rows: List[int]) -> int:
+        """Late tasks in one worker queue, processed in the given order from time zero"""
+        completion = accumulate(map(self.durations.__getitem__, rows))
+        return sum(map(gt, completion, map(self.time_left.__getitem__, rows)))
@@ -0,0 +1,91 @@
+from abc import ABC, abstractmethod
+import json
+import sys
+from typing import List, Optional, TextIO
+
+# Console wording per event kind; fields named in TIME_FIELDS are simulation minutes shown as HH:MM
+TEMPLATES = {
+    "task_arrived": "[{time}] Task '{task}' arrived | Priority: {priority} | Duration: {duration} mins | "
+                    "Tier: {tier} | Resources: {resources}",
+    "task_assigned": "[{time}] Assigned '{task}' to {worker} (Tier {worker_tier})",
+    "task_started": "[{time}] {worker} started '{task}' (ETA: {eta})",
+    "task_completed": "[{time}] {worker} completed '{task}' (was {priority} priority)",
+    "scheduler_run": "[{time}] Running scheduler...",
+    "no_feasible_worker": "Warning: No feasible worker found for task {task}",
+}
+TIME_FIELDS = ("time", "eta")
+
+def format_minutes(minutes: float) -> str:
+    return f"{int(minutes//60):02d}:{int(minutes%60):02d}"
+
+class EventSink(ABC):
+    """Receives scheduler events as a kind, a simulation time and raw field values
+
+    Callers pass unformatted values; a sink only turns them into text if it
+    keeps them. Check `enabled` before computing fields that are not free.
+    """
+    enabled = True
+
+    @abstractmethod
+    def emit(self, kind: str, time: Optional[float], **fields):
+        """Take one event; `time` is in simulation minutes, None when it has none"""
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self) -> "EventSink":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class NullSink(EventSink):
+    """Drops every event; the default for all schedulers"""
+    enabled = False
+
+    def emit(self, kind: str, time: Optional[float], **fields):
+        pass
+
+class ConsoleSink(EventSink):
+    """One human-readable line per event, in the schedulers' original wording"""
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream
+
+    def emit(self, kind: str, time: Optional[float], **fields):
+        values = {name: format_minutes(value) if name in TIME_FIELDS and value is not None else value
+                  for name, value in fields.items()}
+        values["time"] = format_minutes(time) if time is not None else ""
+        template = TEMPLATES.get(kind)
+        if template is None:
+            line = f"[{values.pop('time')}] {kind} " + " ".join(f"{k}={v}" for k, v in values.items())
+        else:
+            line = template.format(**values)
+        print(line, file=self.stream or sys.stdout)
+
+class JsonlSink(EventSink):
+    """One JSON object per event, {"event": kind, "time": minutes, **fields}, written in batches"""
+    def __init__(self, file_path: str, buffer_size: int = 4096):
+        self.file = open(file_path, mode='w')
+        self.buffer_size = buffer_size
+        self._buffer: List[tuple] = []
+
+    def emit(self, kind: str, time: Optional[float], **fields):
+        self._buffer.append((kind, time, fields))
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        # Encoding happens here, once per batch, rather than on the scheduler's path
+        if self._buffer:
+            self.file.writelines(json.dumps({"event": kind, "time": time, **fields}) + "\n"
+                                 for kind, time, fields in self._buffer)
+            self._buffer.clear()
+        self.file.flush()
+
+    def close(self):
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
@@ -1,122 +1,314 @@
-from typing import List, Dict
+from typing import Callable, List, Dict, Iterator, NamedTuple, Optional, Tuple, Union
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-import random
+from itertools import count, islice
+from time import perf_counter
+from array import array
 import copy
-from src.model.task import Task
+import random
+from src.model.task import Task, to_minutes
+from src.model.task_table import TaskTable
 from src.model.worker import Worker
+from src.model.eligibility import EligibilityIndex
+from src.scheduler.assignment import Assignment, materialize
+from src.scheduler.elite import ElitePool, path_relink
+from src.scheduler.evaluation import SolutionEvaluator
+from src.scheduler.event_log import EventSink, NullSink
+from src.scheduler.local_search import LocalSearch
+from src.scheduler.metrics import Metrics, NullMetrics
+from src.scheduler.reactive import ReactiveAlpha
+
+# Per-process state for parallel restarts, set once by the pool initializer
+_pool_context = None
+
+def _init_pool(scheduler, table, order, search, evaluator):
+    global _pool_context
+    _pool_context = (scheduler, table, order, search, evaluator)
+
+def _run_restarts(restarts: List[Tuple[int, int, float]]) -> Tuple[float, int, bytes, Optional[dict]]:
+    """Run (iteration, seed, alpha) restarts and return only the best score and assignment
+
+    Metrics gathered by the chunk come back alongside for the parent to merge.
+    """
+    scheduler, table, order, search, evaluator = _pool_context
+    metrics = scheduler.metrics
+    metrics.reset()
+    best = (float('-inf'), -1, b"")
+    for iteration, seed, alpha in restarts:
+        score, candidate = scheduler._iteration(table, order, search, evaluator, seed, alpha)
+        if score > best[0]:
+            best = (score, iteration, candidate.worker_of.tobytes())
+    return best + (metrics.to_dict() if metrics.enabled else None,)
+
+class GRASPProgress(NamedTuple):
+    iterations: int
+    best_score: float
+    elapsed: float  # Seconds since the first restart started
+    iterations_per_second: float
 
 class GRASPScheduler:
-    def __init__(self, workers: List[Worker], alpha: float = 0.9, max_iterations: int = 100):
+    def __init__(self, workers: List[Worker], alpha: Union[float, ReactiveAlpha] = 0.9,
+                 max_iterations: Optional[int] = 100,
+                 seed: Optional[int] = None, processes: int = 1, search_mode: str = "first",
+                 max_moves: Optional[int] = None, search_time_limit: Optional[float] = None,
+                 elite_size: int = 0, elite_diversity: float = 0.05, events: Optional[EventSink] = None,
+                 metrics: Optional[Metrics] = None):
         self.workers = workers
-        self.alpha = alpha
-        self.max_iterations = max_iterations
+        self.alpha = alpha  # A ReactiveAlpha samples a value per restart and learns from the scores
+        self.max_iterations = max_iterations  # None keeps restarting until an anytime limit stops it
+        self.seed = seed  # Master seed; None draws one from the global random module
+        self.processes = processes  # Restarts run on a process pool when > 1
+        self.search_mode = search_mode  # "first" or "best" improvement
+        self.max_moves = max_moves  # Local search budget per iteration, None runs to a local optimum
+        self.search_time_limit = search_time_limit  # Seconds per local search, None for no limit
+        self.elite_size = elite_size  # Path relinking against an elite pool when > 0
+        self.elite_diversity = elite_diversity  # Minimum share of rows an elite must differ by
+        self.events = events if events is not None else NullSink()  # Infeasible-task warnings
+        self.metrics = metrics if metrics is not None else NullMetrics()  # Per-phase timers and counters
+        self.eligibility = EligibilityIndex(workers, self.metrics)
     
-    def schedule(self, tasks: List[Task]) -> Dict[Worker, List[Task]]:
+    def schedule(self, tasks: Union[List[Task], TaskTable], time_budget: Optional[float] = None,
+                 target_score: Optional[float] = None, max_stall: Optional[int] = None,
+                 progress: Optional[Callable[[GRASPProgress], None]] = None) -> Dict[Worker, List[Task]]:
         best_solution = None
-        best_score = float('-inf')
+        for _, solution in self.iter_solutions(tasks, time_budget, target_score, max_stall, progress):
+            best_solution = solution
+        return best_solution
+    
+    def iter_solutions(self, tasks: Union[List[Task], TaskTable], time_budget: Optional[float] = None,
+                       target_score: Optional[float] = None, max_stall: Optional[int] = None,
+                       progress: Optional[Callable[[GRASPProgress], None]] = None
+                       ) -> Iterator[Tuple[float, Dict[Worker, List[Task]]]]:
+        """Yield (score, solution) every time the best solution improves
+
+        Stops at whichever comes first: max_iterations, time_budget seconds,
+        a best score of at least target_score, or max_stall iterations without
+        improvement. The worker queues always hold the last solution yielded.
+        """
+        if self.max_iterations is None and time_budget is None and target_score is None and max_stall is None:
+            raise ValueError("max_iterations=None needs a time_budget, target_score or max_stall")
+        table = tasks if isinstance(tasks, TaskTable) else TaskTable.from_tasks(tasks)
+        self.eligibility.refresh()
+        self._report_infeasible(table)
+        order = table.sort_order()
+        search = self._local_search_for(table)
+        evaluator = SolutionEvaluator(table, order)
+        seeds = self._iteration_seeds()
+        elite = ElitePool(self.elite_size, self.elite_diversity) if self.elite_size > 0 else None
+        reactive = self.alpha if isinstance(self.alpha, ReactiveAlpha) else None
+        if reactive is not None:
+            reactive.begin()
+        # Relinking and alpha learning need every restart, not just the best of each chunk
+        single = (time_budget is not None or target_score is not None or max_stall is not None
+                  or elite is not None or reactive is not None)
         
-        for _ in range(self.max_iterations):
-            solution = self.construct_solution(copy.deepcopy(tasks))
-            improved_solution = self.local_search(solution)
-            current_score = self.evaluate_solution(improved_solution)
-            
+        if self.processes > 1 and self.max_iterations != 1:
+            restarts = self._parallel_restarts(table, order, search, evaluator, seeds, single)
+        else:
+            restarts = self._serial_restarts(table, order, search, evaluator, seeds)
+        
+        start = perf_counter()
+        best_score = float('-inf')
+        iterations = 0
+        stall = 0
+        for restart, current_score, candidate, alpha in restarts:
+            iterations += restart
+            if reactive is not None:
+                reactive.record(alpha, current_score)
+            if elite is not None:
+                with self.metrics.timer("grasp.path_relink"):
+                    current_score, candidate = self._relink(current_score, candidate, elite, search, evaluator)
             if current_score > best_score:
                 best_score = current_score
-                best_solution = improved_solution
-        
-        return best_solution
+                stall = 0
+                self._reset_workers()
+                yield best_score, materialize(self.workers, table, order, candidate.worker_of)
+            else:
+                stall += restart
+            
+            elapsed = perf_counter() - start
+            if progress is not None:
+                rate = iterations / elapsed if elapsed > 0 else 0.0
+                progress(GRASPProgress(iterations, best_score, elapsed, rate))
+            if ((time_budget is not None and elapsed >= time_budget) or
+                (target_score is not None and best_score >= target_score) or
+                (max_stall is not None and stall >= max_stall)):
+                break
     
-    def construct_solution(self, tasks: List[Task]) -> Dict[Worker, List[Task]]:
-        for worker in self.workers:
-            worker.task_queue = []
-            worker.current_task = None
-            worker.current_load = 0.0
-
-        tasks.sort(key=lambda x: (-x.priority.value, x.due_date))
+    def _iteration_seeds(self) -> Iterator[Tuple[int, int]]:
+        """One seed per restart, derived from the master seed"""
+        master = random.Random(self.seed if self.seed is not None else random.getrandbits(64))
+        iterations = count() if self.max_iterations is None else range(self.max_iterations)
+        for iteration in iterations:
+            yield iteration, master.getrandbits(64)
+    
+    def _alpha_for(self, seed: int) -> float:
+        if isinstance(self.alpha, ReactiveAlpha):
+            return self.alpha.sample(random.Random(seed + 1))
+        return self.alpha
+    
+    def _iteration(self, table: TaskTable, order: List[int], search: LocalSearch,
+                   evaluator: SolutionEvaluator, seed: int, alpha: float) -> Tuple[float, Assignment]:
+        metrics = self.metrics
+        with metrics.timer("grasp.construct"):
+            candidate = self._construct(table, order, random.Random(seed), alpha)
+        with metrics.timer("grasp.local_search"):
+            search.run(candidate)
+        with metrics.timer("grasp.evaluate"):
+            score = evaluator.score(candidate)
+        metrics.inc("grasp.iterations")
+        return score, candidate
+    
+    def _serial_restarts(self, table: TaskTable, order: List[int], search: LocalSearch,
+                         evaluator: SolutionEvaluator, seeds: Iterator[Tuple[int, int]]
+                         ) -> Iterator[Tuple[int, float, Assignment, float]]:
+        for _, seed in seeds:
+            alpha = self._alpha_for(seed)
+            current_score, candidate = self._iteration(table, order, search, evaluator, seed, alpha)
+            yield 1, current_score, candidate, alpha
+    
+    def _relink(self, score: float, candidate: Assignment, elite: ElitePool, search: LocalSearch,
+                evaluator: SolutionEvaluator) -> Tuple[float, Assignment]:
+        """Relink a new local optimum with the elite pool and keep the better of the two"""
+        guide = elite.guide_for(candidate)
+        elite.add(score, candidate)
+        if guide is None:
+            return score, candidate
+        relinked = path_relink(candidate, guide, evaluator)
+        if relinked is None:
+            return score, candidate
         
-        solution = {worker: [] for worker in self.workers}
+        relinked_candidate = relinked[1]
+        search.run(relinked_candidate)
+        relinked_score = evaluator.score(relinked_candidate)
+        elite.add(relinked_score, relinked_candidate)
+        if relinked_score > score:
+            return relinked_score, relinked_candidate
+        return score, candidate
+    
+    def _parallel_restarts(self, table: TaskTable, order: List[int], search: LocalSearch,
+                           evaluator: SolutionEvaluator, seeds: Iterator[Tuple[int, int]],
+                           single: bool) -> Iterator[Tuple[int, float, Assignment, float]]:
+        # Chunks are consumed in iteration order and a chunk only reports its best,
+        # earliest restart, so the overall winner does not depend on the pool size.
+        # Anytime, relinking and reactive runs use single-restart chunks so every
+        # stop check, the elite pool and the alpha statistics see every result.
+        if single or self.max_iterations is None:
+            chunk_size = 1
+        else:
+            chunk_size = max(1, self.max_iterations // (self.processes * 4))
+        # A reactive alpha only changes every `period` restarts; holding back the
+        # next period until the current one is recorded keeps its draws identical
+        # to a serial run
+        period = self.alpha.period if isinstance(self.alpha, ReactiveAlpha) else None
+        pool = ProcessPoolExecutor(max_workers=self.processes, initializer=_init_pool,
+                                   initargs=(self._pool_copy(), table, order, search, evaluator))
+        try:
+            pending = deque()
+            submitted = consumed = 0
+            exhausted = False
+            while True:
+                while (not exhausted and len(pending) < self.processes * 2 and
+                       (period is None or submitted // period * period <= consumed)):
+                    chunk = [(iteration, seed, self._alpha_for(seed))
+                             for iteration, seed in islice(seeds, chunk_size)]
+                    if not chunk:
+                        exhausted = True
+                        break
+                    pending.append((chunk, pool.submit(_run_restarts, chunk)))
+                    submitted += len(chunk)
+                if not pending:
+                    break
+                
+                chunk, future = pending.popleft()
+                current_score, best_iteration, best_bytes, chunk_metrics = future.result()
+                consumed += len(chunk)
+                if chunk_metrics is not None:
+                    self.metrics.merge(chunk_metrics)
+                if best_iteration < 0:
+                    continue
+                assignment = array('i')
+                assignment.frombytes(best_bytes)
+                alpha = chunk[best_iteration - chunk[0][0]][2]
+                yield (len(chunk), current_score,
+                       Assignment.from_array(table.duration, len(self.workers), assignment), alpha)
+        finally:
+            pool.shutdown(cancel_futures=True)
+    
+    def construct_solution(self, tasks: Union[List[Task], TaskTable]) -> Dict[Worker, List[Task]]:
+        table = tasks if isinstance(tasks, TaskTable) else TaskTable.from_tasks(tasks)
+        self.eligibility.refresh()
+        self._report_infeasible(table)
+        order = table.sort_order()
+        alpha = self.alpha.sample(random) if isinstance(self.alpha, ReactiveAlpha) else self.alpha
+        candidate = self._construct(table, order, random, alpha)
+        self._reset_workers()
+        return materialize(self.workers, table, order, candidate.worker_of)
+    
+    def local_search(self, solution: Dict[Worker, List[Task]]) -> Dict[Worker, List[Task]]:
+        table, candidate = Assignment.from_solution(self.workers, solution)
+        order = table.sort_order()
+        self._local_search_for(table).run(candidate)
+        self._reset_workers()
+        return materialize(self.workers, table, order, candidate.worker_of)
+    
+    def evaluate_solution(self, solution: Dict[Worker, List[Task]]) -> float:
+        table, candidate = Assignment.from_solution(self.workers, solution)
+        return SolutionEvaluator(table, table.sort_order()).score(candidate)
+    
+    def _construct(self, table: TaskTable, order: List[int], rng, alpha: float) -> Assignment:
+        candidate = Assignment(table.duration, len(self.workers))
+        loads = candidate.loads
         
-        for task in tasks:
-            feasible_workers = [w for w in self.workers if w.can_accept(task)]
+        for i in order:
+            feasible_workers = self.eligibility.positions_for(table.class_key(i))
             
             if not feasible_workers:
-                print(f"Warning: No feasible worker found for task {task.name}")
                 continue
 
-            worker_scores = []
-            for worker in feasible_workers:
-                score = worker.current_load
-                worker_scores.append((score, worker))
-
-            worker_scores.sort(key=lambda x: x[0])
+            worker_scores = sorted((loads[k], k) for k in feasible_workers)
             min_score = worker_scores[0][0]
             max_score = worker_scores[-1][0]
-            threshold = min_score + self.alpha * (max_score - min_score)
+            threshold = min_score + alpha * (max_score - min_score)
             rcl = [ws[1] for ws in worker_scores if ws[0] <= threshold]
-            selected_worker = random.choice(rcl)
-            selected_worker.add_task(task)
-            solution[selected_worker].append(task)
+            candidate.assign(i, rng.choice(rcl))
         
-        return solution
-    
-    def local_search(self, solution: Dict[Worker, List[Task]]) -> Dict[Worker, List[Task]]:
-        improved = True
-        max_passes = 10
-        passes = 0
-        
-        while improved and passes < max_passes:
-            improved = False
-            passes += 1
+        return candidate
 
-            for worker1, tasks1 in solution.items():
-                for worker2, tasks2 in solution.items():
-                    if worker1 == worker2:
-                        continue
-                    for i, task1 in enumerate(tasks1):
-                        for j, task2 in enumerate(tasks2):
-                            if (worker1.can_accept(task2) and worker2.can_accept(task1) and
-                                self._swap_improves(worker1, task1, worker2, task2)):
-                                tasks1[i], tasks2[j] = tasks2[j], tasks1[i]
-                                worker1.task_queue.remove(task1)
-                                worker2.task_queue.remove(task2)
-                                worker1.add_task(task2)
-                                worker2.add_task(task1)
-                                improved = True
-                                break
-                        if improved:
-                            break
-                    if improved:
-                        break
-                if improved:
-                    break
-        
-        return solution
-    
-    def _swap_improves(self, worker1: Worker, task1: Task, worker2: Worker, task2: Task) -> bool:
-        original_load_diff = abs(worker1.current_load - worker2.current_load)
-        new_load1 = worker1.current_load - task1.estimated_duration + task2.estimated_duration
-        new_load2 = worker2.current_load - task2.estimated_duration + task1.estimated_duration
-        new_load_diff = abs(new_load1 - new_load2)
-        return new_load_diff < original_load_diff
+    def _pool_copy(self) -> "GRASPScheduler":
+        """The scheduler as pool workers get it, without the event sink
+
+        Workers never emit events, and a sink holding an open file cannot be
+        pickled for processes started with spawn.
+        """
+        pool_copy = copy.copy(self)
+        pool_copy.events = NullSink()
+        return pool_copy
+
+    def _report_infeasible(self, table: TaskTable):
+        """One warning per task no worker can take, rather than one per restart"""
+        if self.events.enabled:
+            for i in range(len(table)):
+                if not self.eligibility.positions_for(table.class_key(i)):
+                    self.events.emit("no_feasible_worker", None, task=table.name(i))
+
+    def _local_search_for(self, table: TaskTable) -> LocalSearch:
+        """Relocate/swap search over the eligibility classes of the table's rows"""
+        row_class, class_workers = self.eligibility.classify(table.class_key(i) for i in range(len(table)))
+        return LocalSearch(row_class, class_workers, self.search_mode,
+                           self.max_moves, self.search_time_limit, self.metrics)
     
-    def evaluate_solution(self, solution: Dict[Worker, List[Task]]) -> float:
-        makespan = max(w.current_load for w in self.workers)
-        priority_score = sum(-t.priority.value for w in self.workers for t in w.task_queue)
-        current_time = 0
-        due_date_penalty = 0
+    def _reset_workers(self):
         for worker in self.workers:
-            completion_time = current_time
-            for task in worker.task_queue:
-                completion_time += task.estimated_duration
-                if completion_time > (task.due_date - datetime.now()).total_seconds() / 60:
-                    due_date_penalty += 100
-
-        score = -makespan + priority_score - due_date_penalty
-        return score
+            worker.task_queue.clear()
+            worker.current_task = None
+            worker.current_load = 0.0
     
     def simulate_execution(self, solution: Dict[Worker, List[Task]]) -> Dict[str, float]:
         worker_timelines = {worker.name: 0.0 for worker in self.workers}
         violations = {}
+        now = to_minutes(datetime.now())
         
         while True:
             next_worker = None
@@ -124,7 +316,7 @@ class GRASPScheduler:
             
             for worker in self.workers:
                 if worker.task_queue:
-                    completion_time = worker_timelines[worker.name] + worker.task_queue[0].estimated_duration
+                    completion_time = worker_timelines[worker.name] + worker.task_queue.peek().estimated_duration
                     if completion_time < next_time:
                         next_time = completion_time
                         next_worker = worker
@@ -132,9 +324,9 @@ class GRASPScheduler:
             if not next_worker:
                 break
 
-            task = next_worker.task_queue.pop(0)
+            task = next_worker.task_queue.popleft()
             worker_timelines[next_worker.name] = next_time
-            due_in_minutes = (task.due_date - datetime.now()).total_seconds() / 60
+            due_in_minutes = task.deadline - now
             if next_time > due_in_minutes:
                 violations[task.name] = next_time - due_in_minutes
         
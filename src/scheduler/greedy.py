@@ -1,51 +1,61 @@
-from typing import List, Dict
+from typing import List, Dict, Optional, Union
+from array import array
 from datetime import datetime
-import copy
-from src.model.task import Task
+from src.model.task import Task, to_minutes
+from src.model.task_table import TaskTable
 from src.model.worker import Worker
+from src.model.eligibility import EligibilityIndex
+from src.scheduler.assignment import UNASSIGNED, materialize
+from src.scheduler.event_log import EventSink, NullSink
+from src.scheduler.metrics import Metrics, NullMetrics
 
 class GREEDYScheduler:
-    def __init__(self, workers: List[Worker]):
+    def __init__(self, workers: List[Worker], events: Optional[EventSink] = None,
+                 metrics: Optional[Metrics] = None):
         self.workers = workers
+        self.metrics = metrics if metrics is not None else NullMetrics()
+        self.eligibility = EligibilityIndex(workers, self.metrics)
+        self.events = events if events is not None else NullSink()  # Infeasible-task warnings
     
-    def schedule(self, tasks: List[Task]) -> Dict[Worker, List[Task]]:
-        solution = self.construct_solution(copy.deepcopy(tasks))
+    def schedule(self, tasks: Union[List[Task], TaskTable]) -> Dict[Worker, List[Task]]:
+        solution = self.construct_solution(tasks)
         
         return solution
     
-    def construct_solution(self, tasks: List[Task]) -> Dict[Worker, List[Task]]:
+    def construct_solution(self, tasks: Union[List[Task], TaskTable]) -> Dict[Worker, List[Task]]:
+        with self.metrics.timer("greedy.construct"):
+            return self._construct(tasks)
+
+    def _construct(self, tasks: Union[List[Task], TaskTable]) -> Dict[Worker, List[Task]]:
+        table = tasks if isinstance(tasks, TaskTable) else TaskTable.from_tasks(tasks)
         for worker in self.workers:
-            worker.task_queue = []
+            worker.task_queue.clear()
             worker.current_task = None
-            worker.available_capacity = worker.capacity
             worker.current_load = 0.0
 
-        tasks.sort(key=lambda x: (-x.priority.value, x.due_date))
-        
-        solution = {worker: [] for worker in self.workers}
+        self.eligibility.refresh()
+        order = table.sort_order()
+        loads = [0.0] * len(self.workers)
+        assignment = array('i', [UNASSIGNED]) * len(table)
         
-        for task in tasks:
-            feasible_workers = [w for w in self.workers if w.can_accept(task)]
+        for i in order:
+            feasible_workers = self.eligibility.positions_for(table.class_key(i))
             
             if not feasible_workers:
-                print(f"Warning: No feasible worker found for task {task.name}")
+                if self.events.enabled:
+                    self.events.emit("no_feasible_worker", None, task=table.name(i))
                 continue
 
-            worker_scores = []
-            for worker in feasible_workers:
-                score = worker.current_load
-                worker_scores.append((score, worker))
-
-            worker_scores.sort(key=lambda x: x[0])
-            selected_worker = worker_scores[0][1]
-            selected_worker.add_task(task)
-            solution[selected_worker].append(task)
+            selected_worker = min(feasible_workers, key=loads.__getitem__)
+            assignment[i] = selected_worker
+            loads[selected_worker] += table.duration[i]
         
-        return solution
+        return materialize(self.workers, table, order, assignment)
     
     def simulate_execution(self, solution: Dict[Worker, List[Task]]) -> Dict[str, float]:
         worker_timelines = {worker.name: 0.0 for worker in self.workers}
         violations = {}
+        now = to_minutes(datetime.now())
         
         while True:
             next_worker = None
@@ -53,7 +63,7 @@ class GREEDYScheduler:
             
             for worker in self.workers:
                 if worker.task_queue:
-                    completion_time = worker_timelines[worker.name] + worker.task_queue[0].estimated_duration
+                    completion_time = worker_timelines[worker.name] + worker.task_queue.peek().estimated_duration
                     if completion_time < next_time:
                         next_time = completion_time
                         next_worker = worker
@@ -61,10 +71,10 @@ class GREEDYScheduler:
             if not next_worker:
                 break
 
-            task = next_worker.task_queue.pop(0)
+            task = next_worker.task_queue.popleft()
             worker_timelines[next_worker.name] = next_time
-            due_in_days = (task.due_date - datetime.now().date()).days
-            if next_time > due_in_days:
-                violations[task.name] = next_time - due_in_days
+            due_in_minutes = task.deadline - now
+            if next_time > due_in_minutes:
+                violations[task.name] = next_time - due_in_minutes
         
         return violations
\ No newline at end of file
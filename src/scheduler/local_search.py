@@ -0,0 +1,190 @@
+from bisect import bisect_left, insort
+from collections import deque
+from time import perf_counter
+from typing import Dict, FrozenSet, List, Optional, Sequence
+from src.scheduler.assignment import UNASSIGNED, Assignment
+from src.scheduler.metrics import Metrics, NullMetrics
+
+MODES = ("first", "best")
+MIN_GAIN = 1e-9
+
+class _Bucket:
+    """Rows of one eligibility class on one worker, grouped by duration"""
+    def __init__(self):
+        self.durations: List[float] = []  # Distinct durations, sorted
+        self.rows: Dict[float, Dict[int, None]] = {}  # Insertion-ordered row sets
+
+    def add(self, row: int, duration: float):
+        rows = self.rows.get(duration)
+        if rows is None:
+            rows = self.rows[duration] = {}
+            insort(self.durations, duration)
+        rows[row] = None
+
+    def remove(self, row: int, duration: float):
+        rows = self.rows[duration]
+        del rows[row]
+        if not rows:
+            del self.rows[duration]
+            del self.durations[bisect_left(self.durations, duration)]
+
+    def first_row(self, duration: float) -> int:
+        return next(iter(self.rows[duration]))
+
+class LocalSearch:
+    """Relocate/swap descent on per-worker loads with O(1) move deltas
+
+    The objective is the sum of squared worker loads. Moving duration x from a
+    worker with load l_a to one with load l_b lowers it by 2x(l_a - l_b - x), so
+    a move is scored from two loads and a duration, and the best move between
+    two workers is found by bisecting their duration-sorted buckets. Workers
+    touched by a move are re-examined; a pair with unchanged loads and contents
+    is never rescanned, so the search stops at a true local optimum unless the
+    move or time budget runs out first.
+    """
+    def __init__(self, row_class: Sequence[int], class_workers: List[FrozenSet[int]],
+                 mode: str = "first", max_moves: Optional[int] = None,
+                 time_limit: Optional[float] = None, metrics: Optional[Metrics] = None):
+        if mode not in MODES:
+            raise ValueError(f"Unknown local search mode '{mode}', expected one of {MODES}")
+        self.row_class = row_class
+        self.class_workers = class_workers
+        self.mode = mode
+        self.max_moves = max_moves
+        self.time_limit = time_limit
+        self.metrics = metrics if metrics is not None else NullMetrics()
+        self._pairs_tried = 0
+
+    def run(self, candidate: Assignment) -> int:
+        """Improve the candidate in place and return the number of moves applied"""
+        loads = candidate.loads
+        buckets: List[Dict[int, _Bucket]] = [{} for _ in loads]
+        for row, position in enumerate(candidate.worker_of):
+            if position != UNASSIGNED:
+                self._bucket(buckets, position, self.row_class[row]).add(row, candidate.durations[row])
+
+        # Every move takes a row off some worker, so a worker without rows only
+        # needs examining once a move has touched it
+        dirty = deque(position for position in range(len(loads)) if buckets[position])
+        queued = [bool(worker_buckets) for worker_buckets in buckets]
+        deadline = perf_counter() + self.time_limit if self.time_limit is not None else None
+        moves = swaps = 0
+        self._pairs_tried = 0
+
+        while dirty:
+            if self.max_moves is not None and moves >= self.max_moves:
+                break
+            if deadline is not None and perf_counter() > deadline:
+                break
+
+            worker = dirty.popleft()
+            queued[worker] = False
+            move = self._find_move(worker, loads, buckets)
+            if move is None:
+                continue
+
+            self._apply(move, candidate, buckets)
+            moves += 1
+            if move[5] is not None:
+                swaps += 1
+            other = move[4] if move[1] == worker else move[1]
+            queued[worker] = True
+            dirty.appendleft(worker)
+            if not queued[other]:
+                queued[other] = True
+                dirty.append(other)
+
+        if self.metrics.enabled:
+            # Tallied in locals and flushed once so the move loop stays uninstrumented;
+            # pairs_tried counts worker pairs, each yielding at most one applied move
+            self.metrics.inc("local_search.runs")
+            self.metrics.inc("local_search.pairs_tried", self._pairs_tried)
+            self.metrics.inc("local_search.relocates_applied", moves - swaps)
+            self.metrics.inc("local_search.swaps_applied", swaps)
+        return moves
+
+    def _find_move(self, worker: int, loads: List[float], buckets) -> Optional[tuple]:
+        """Best move between this worker and any other (the first improving pair in first mode)"""
+        best = None
+        pairs = 0  # Heavy/light worker pairs examined, whatever number of buckets each probed
+        for other in range(len(loads)):
+            if loads[worker] > loads[other]:
+                move = self._pair_move(worker, other, loads[worker] - loads[other], buckets)
+            elif loads[other] > loads[worker]:
+                move = self._pair_move(other, worker, loads[other] - loads[worker], buckets)
+            else:
+                continue
+            pairs += 1
+            if move is not None and (best is None or move[0] > best[0]):
+                best = move
+                if self.mode == "first":
+                    break
+        self._pairs_tried += pairs
+        return best
+
+    def _pair_move(self, heavy: int, light: int, gap: float, buckets) -> Optional[tuple]:
+        """Best relocate or swap from the heavier worker to the lighter one
+
+        A move's gain depends only on the durations it exchanges, so swaps are
+        searched over the distinct durations each worker could hand the other,
+        merged across classes, rather than over every pair of classes.
+        """
+        class_workers = self.class_workers
+        half = gap / 2
+        best = None
+        best_gain = MIN_GAIN
+        outgoing: Dict[float, int] = {}  # Duration -> first class holding it that light accepts
+        for row_class, bucket in buckets[heavy].items():
+            if light in class_workers[row_class]:
+                for duration in bucket.durations:
+                    outgoing.setdefault(duration, row_class)
+        if not outgoing:
+            return None
+
+        outgoing_durations = sorted(outgoing)
+        index = bisect_left(outgoing_durations, half)
+        for duration in outgoing_durations[max(index - 1, 0):index + 1]:
+            gain = duration * (gap - duration)
+            if 0 < duration < gap and gain > best_gain:
+                best_gain = gain
+                best = (gain, heavy, outgoing[duration], duration, light, None, None)
+
+        incoming: Dict[float, int] = {}  # Duration -> first class holding it that heavy accepts
+        for other_class, other_bucket in buckets[light].items():
+            if heavy in class_workers[other_class]:
+                for other_duration in other_bucket.durations:
+                    incoming.setdefault(other_duration, other_class)
+        if not incoming:
+            return best
+
+        incoming_durations = sorted(incoming)
+        for duration, row_class in outgoing.items():
+            index = bisect_left(incoming_durations, duration - half)
+            for other_duration in incoming_durations[max(index - 1, 0):index + 1]:
+                delta = duration - other_duration
+                gain = delta * (gap - delta)
+                if 0 < delta < gap and gain > best_gain:
+                    best_gain = gain
+                    best = (gain, heavy, row_class, duration, light, incoming[other_duration], other_duration)
+        return best
+
+    def _apply(self, move: tuple, candidate: Assignment, buckets):
+        _, heavy, row_class, duration, light, other_class, other_duration = move
+        bucket = buckets[heavy][row_class]
+        row = bucket.first_row(duration)
+        bucket.remove(row, duration)
+        self._bucket(buckets, light, row_class).add(row, duration)
+        candidate.assign(row, light)
+        if other_class is not None:
+            other_bucket = buckets[light][other_class]
+            other_row = other_bucket.first_row(other_duration)
+            other_bucket.remove(other_row, other_duration)
+            self._bucket(buckets, heavy, other_class).add(other_row, other_duration)
+            candidate.assign(other_row, heavy)
+
+    @staticmethod
+    def _bucket(buckets, position: int, row_class: int) -> _Bucket:
+        bucket = buckets[position].get(row_class)
+        if bucket is None:
+            bucket = buckets[position][row_class] = _Bucket()
+        return bucket
@@ -0,0 +1,126 @@
+import json
+from contextlib import nullcontext
+from time import perf_counter
+from typing import Dict, List, Optional, Tuple
+
+_NO_TIMER = nullcontext()
+
+class _Timer:
+    def __init__(self, metrics: "Metrics", name: str):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.started = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.metrics.observe(self.name, perf_counter() - self.started)
+
+class Metrics:
+    """Counters, timers and gauges collected inside the schedulers
+
+    Counters only go up. Timers keep a count, a total and a maximum in seconds.
+    Gauges keep their latest value and, when given a simulation time, a series
+    sampled at most once every `sample_interval` minutes. Names are dotted,
+    e.g. 'grasp.construct'.
+    """
+    enabled = True
+
+    def __init__(self, sample_interval: float = 1.0):
+        self.sample_interval = sample_interval
+        self.reset()
+
+    def reset(self):
+        self.counters: Dict[str, float] = {}
+        self.timers: Dict[str, List[float]] = {}  # name -> [count, total, max]
+        self.gauges: Dict[str, float] = {}
+        self.series: Dict[str, List[Tuple[float, float]]] = {}
+
+    def inc(self, name: str, amount: float = 1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def observe(self, name: str, seconds: float):
+        timer = self.timers.get(name)
+        if timer is None:
+            self.timers[name] = [1, seconds, seconds]
+        else:
+            timer[0] += 1
+            timer[1] += seconds
+            if seconds > timer[2]:
+                timer[2] = seconds
+
+    def timer(self, name: str):
+        """Context manager that observes the time spent in its block"""
+        return _Timer(self, name)
+
+    def gauge(self, name: str, value: float, time: Optional[float] = None):
+        self.gauges[name] = value
+        if time is None:
+            return
+        samples = self.series.get(name)
+        if samples is None:
+            self.series[name] = [(time, value)]
+        elif time - samples[-1][0] >= self.sample_interval:
+            samples.append((time, value))
+
+    def merge(self, state: dict):
+        """Add in counters and timers from another Metrics' to_dict, e.g. from a pool worker"""
+        for name, amount in state.get("counters", {}).items():
+            self.inc(name, amount)
+        for name, timer in state.get("timers", {}).items():
+            current = self.timers.setdefault(name, [0, 0.0, 0.0])
+            current[0] += timer["count"]
+            current[1] += timer["total"]
+            current[2] = max(current[2], timer["max"])
+
+    def to_dict(self) -> dict:
+        return {
+            "counters": dict(self.counters),
+            "timers": {name: {"count": c, "total": t, "max": m, "mean": t / c if c else 0.0}
+                       for name, (c, t, m) in self.timers.items()},
+            "gauges": dict(self.gauges),
+            "series": {name: [list(sample) for sample in samples] for name, samples in self.series.items()},
+        }
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def to_prometheus(self, prefix: str = "scheduler") -> str:
+        """Prometheus text exposition; series are JSON-only"""
+        lines = []
+        for name, value in sorted(self.counters.items()):
+            metric = _metric_name(prefix, name) + "_total"
+            lines += [f"# TYPE {metric} counter", f"{metric} {value}"]
+        for name, (c, t, m) in sorted(self.timers.items()):
+            metric = _metric_name(prefix, name) + "_seconds"
+            lines += [f"# TYPE {metric} summary", f"{metric}_count {c}", f"{metric}_sum {t}",
+                      f"# TYPE {metric}_max gauge", f"{metric}_max {m}"]
+        for name, value in sorted(self.gauges.items()):
+            metric = _metric_name(prefix, name)
+            lines += [f"# TYPE {metric} gauge", f"{metric} {value}"]
+        return "\n".join(lines) + "\n"
+
+    def save(self, file_path: str):
+        """JSON, or Prometheus text when the file name ends in .prom"""
+        with open(file_path, mode='w') as f:
+            f.write(self.to_prometheus() if file_path.endswith(".prom") else self.to_json())
+
+class NullMetrics(Metrics):
+    """Ignores everything; the default for all schedulers"""
+    enabled = False
+
+    def inc(self, name: str, amount: float = 1):
+        pass
+
+    def observe(self, name: str, seconds: float):
+        pass
+
+    def timer(self, name: str):
+        return _NO_TIMER
+
+    def gauge(self, name: str, value: float, time: Optional[float] = None):
+        pass
+
+def _metric_name(prefix: str, name: str) -> str:
+    return f"{prefix}_{name}".replace(".", "_").replace("-", "_")
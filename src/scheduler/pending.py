@@ -0,0 +1,116 @@
+from heapq import heapify, heappop, heappush
+from itertools import count
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from src.model.eligibility import EligibilityIndex
+from src.model.task import Task
+
+# Slack kept when popping startable tasks so float rounding never hides a task
+# that the schedulers' exact deadline check would accept
+START_TOLERANCE = 1e-6
+
+def order_key(task: Task) -> tuple:
+    """The dynamic schedulers' dispatch order: HIGH priority first, then earliest deadline"""
+    return (-task.priority.value, task.deadline)
+
+class PendingTasks:
+    """Unassigned tasks of a dynamic simulation, partitioned by eligibility class
+
+    Each class keeps a max-heap on the latest minute a task can start and still
+    meet its deadline, so finding the tasks a class's least-loaded worker could
+    still finish in time pops only those tasks and leaves the rest, including
+    ones already past saving, untouched. Removal is lazy: a removed task's heap
+    entry is dropped when it reaches the top or the class is next listed.
+    Iterating yields the tasks in arrival order.
+    """
+    def __init__(self, eligibility: EligibilityIndex, deadline_of: Callable[[Task], float]):
+        self.eligibility = eligibility
+        self.deadline_of = deadline_of  # Task -> deadline on the simulation clock
+        self._entries: Dict[Task, Tuple[tuple, int, tuple]] = {}  # Task -> (order key, seq, class key)
+        self._heaps: Dict[tuple, List[Tuple[float, int, Task]]] = {}  # Class -> [(-latest start, seq, task)]
+        self._worker_classes: List[List[tuple]] = [[] for _ in eligibility.workers]
+        self._seq = count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, task: Task) -> bool:
+        return task in self._entries
+
+    def __iter__(self) -> Iterator[Task]:
+        return iter(self._entries)
+
+    def add(self, task: Task) -> tuple:
+        """Queue a task and return its class key"""
+        entry = self.admit(task)
+        heappush(self._heaps[self._entries[task][2]], entry)
+        return self._entries[task][2]
+
+    def admit(self, task: Task) -> Tuple[float, int, Task]:
+        """Register a task without queueing it, for a caller that tries it right away
+
+        The returned entry must go to restore if the task is still pending afterwards.
+        """
+        key = self.eligibility.task_class(task)
+        seq = next(self._seq)
+        self._entries[task] = (order_key(task), seq, key)
+        if key not in self._heaps:
+            self._heaps[key] = []
+            for position in self.eligibility.positions_for(key):
+                self._worker_classes[position].append(key)
+        return (task.estimated_duration - self.deadline_of(task), seq, task)
+
+    def remove(self, task: Task):
+        del self._entries[task]
+
+    def classes(self) -> Iterable[tuple]:
+        return self._heaps.keys()
+
+    def classes_of(self, position: int) -> List[tuple]:
+        """Classes seen so far that the worker at this fleet position can take"""
+        return self._worker_classes[position]
+
+    def reindex(self):
+        """Rebuild the worker-to-class map after the eligibility index was invalidated"""
+        self._worker_classes = [[] for _ in self.eligibility.workers]
+        for key in self._heaps:
+            for position in self.eligibility.positions_for(key):
+                self._worker_classes[position].append(key)
+
+    def pop_startable(self, key: tuple, earliest_start: float) -> List[Tuple[float, int, Task]]:
+        """Pop the class's heap entries whose task can still start at earliest_start"""
+        heap = self._heaps[key]
+        if not heap:
+            return []
+        entries = self._entries
+        limit = -(earliest_start - START_TOLERANCE)
+        popped = []
+        while heap and heap[0][0] <= limit:
+            entry = heappop(heap)
+            if entry[2] in entries:
+                popped.append(entry)
+        return popped
+
+    def restore(self, entry: Tuple[float, int, Task]):
+        """Put back an entry from pop_startable whose task stays pending"""
+        heappush(self._heaps[self._entries[entry[2]][2]], entry)
+
+    def dispatch_order(self, task: Task) -> Tuple[tuple, int]:
+        """Sort key giving order_key with ties in arrival order"""
+        order, seq, _ = self._entries[task]
+        return order, seq
+
+    def ordered(self, keys: Optional[Iterable[tuple]] = None) -> List[Task]:
+        """Pending tasks of the given classes, or of all classes, in dispatch order"""
+        entries = self._entries
+        if keys is None:
+            return sorted(entries, key=self.dispatch_order)
+        tasks = []
+        for key in keys:
+            heap = self._heaps[key]
+            live = [entry for entry in heap if entry[2] in entries]
+            if len(live) < len(heap):
+                heapify(live)
+                self._heaps[key] = live
+            tasks.extend(entry[2] for entry in live)
+        tasks.sort(key=self.dispatch_order)
+        return tasks
@@ -0,0 +1,96 @@
+import json
+from typing import Dict, Optional, Sequence
+
+DEFAULT_ALPHAS = (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9)
+MIN_PROBABILITY = 0.01
+
+class ReactiveAlpha:
+    """Self-tuning RCL alpha for reactive GRASP
+
+    Alpha is sampled from a discrete set. Every `period` recorded iterations the
+    probabilities are recomputed from the average score each value produced
+    relative to the best score of the run, raised to `amplification` so good
+    values pull ahead quickly. Values never tried keep full weight and every
+    value keeps a small floor, so the search never stops exploring. The
+    probabilities can be saved and passed back in to warm-start later runs.
+    """
+    def __init__(self, alphas: Sequence[float] = DEFAULT_ALPHAS, period: int = 10,
+                 amplification: float = 10.0, probabilities: Optional[Sequence[float]] = None):
+        if not alphas:
+            raise ValueError("ReactiveAlpha needs at least one alpha value")
+        if probabilities is not None and len(probabilities) != len(alphas):
+            raise ValueError("One probability is needed per alpha value")
+        self.alphas = tuple(alphas)
+        self.period = period
+        self.amplification = amplification
+        if probabilities is None:
+            self.probabilities = [1 / len(self.alphas)] * len(self.alphas)
+        else:
+            total = sum(probabilities)
+            self.probabilities = [p / total for p in probabilities]
+        self.begin()
+
+    def begin(self):
+        """Reset the score statistics; scores from different runs are not comparable"""
+        self._totals = [0.0] * len(self.alphas)
+        self._counts = [0] * len(self.alphas)
+        self._best = float('-inf')
+        self._recorded = 0
+
+    def sample(self, rng) -> float:
+        return rng.choices(self.alphas, weights=self.probabilities)[0]
+
+    def record(self, alpha: float, score: float):
+        k = self.alphas.index(alpha)
+        self._totals[k] += score
+        self._counts[k] += 1
+        self._best = max(self._best, score)
+        self._recorded += 1
+        if self._recorded % self.period == 0:
+            self.update()
+
+    def update(self):
+        averages = [total / n for total, n in zip(self._totals, self._counts) if n]
+        if not averages:
+            return
+        worst = min(averages)
+        spread = self._best - worst
+        weights = []
+        for total, n in zip(self._totals, self._counts):
+            if not n or spread <= 0:
+                weights.append(1.0)
+            else:
+                weights.append(((total / n - worst) / spread) ** self.amplification)
+        total_weight = sum(weights)
+        probabilities = [max(w / total_weight, MIN_PROBABILITY) for w in weights]
+        total = sum(probabilities)
+        self.probabilities = [p / total for p in probabilities]
+
+    @property
+    def distribution(self) -> Dict[float, float]:
+        return dict(zip(self.alphas, self.probabilities))
+
+    def to_dict(self) -> dict:
+        return {
+            "alphas": list(self.alphas),
+            "probabilities": list(self.probabilities),
+            "period": self.period,
+            "amplification": self.amplification,
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict) -> "ReactiveAlpha":
+        return cls(state["alphas"], state.get("period", 10), state.get("amplification", 10.0),
+                   state.get("probabilities"))
+
+    def save(self, file_path: str):
+        with open(file_path, mode='w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @classmethod
+    def load(cls, file_path: str) -> "ReactiveAlpha":
+        with open(file_path, mode='r') as f:
+            return cls.from_dict(json.load(f))
+
+    def __str__(self) -> str:
+        return "reactive " + ", ".join(f"{a:g}:{p:.2f}" for a, p in self.distribution.items())
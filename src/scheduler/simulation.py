@@ -0,0 +1,244 @@
+from abc import ABC, abstractmethod
+from enum import Enum
+from heapq import heappush, heappop
+from itertools import count
+from time import perf_counter
+from typing import Dict, Iterable, Iterator, List, Optional
+from src.model.task import Task
+from src.model.worker import Worker
+from src.model.eligibility import EligibilityIndex
+from src.scheduler.event_log import EventSink, NullSink
+from src.scheduler.metrics import Metrics, NullMetrics
+from src.scheduler.pending import PendingTasks
+
+class EventType(Enum):
+    TASK_ARRIVAL = 1
+    TASK_COMPLETION = 2
+    REPLAN = 3  # Wake-up for a scheduler run held back by a minimum run interval
+
+_event_seq = count()
+
+class Event:
+    __slots__ = ("event_type", "time", "task", "worker", "seq")
+
+    def __init__(self, event_type: EventType, time: float, task: Optional[Task] = None,
+                 worker: Optional[Worker] = None):
+        self.event_type = event_type
+        self.time = time  # Simulation time in minutes
+        self.task = task
+        self.worker = worker  # The worker running the task, for completions
+        self.seq = next(_event_seq)  # Creation order, so equal times pop first in, first out
+
+    def __lt__(self, other):
+        return self.time < other.time or (self.time == other.time and self.seq < other.seq)
+
+class EventDrivenScheduler(ABC):
+    """Event loop shared by the dynamic schedulers
+
+    Owns the simulation clock, the event heap and the lazily read arrival
+    stream, batches events by `coalesce_window`, and keeps the pending tasks,
+    running tasks and completion times. Subclasses supply the assignment
+    policy through _admit, _task_finished and _schedule, and the console
+    report through _start_message and _print_report, printed only when verbose.
+    """
+    def __init__(self, workers: List[Worker], events: Optional[EventSink] = None,
+                 metrics: Optional[Metrics] = None, coalesce_window: Optional[float] = 0.0,
+                 verbose: bool = False):
+        self.workers = workers
+        self.verbose = verbose  # Print a start line and a final report around run_simulation
+        self.coalesce_window = coalesce_window  # Minutes of events handled per scheduler pass, None for one event
+        self.metrics = metrics if metrics is not None else NullMetrics()  # Event rates, queue depths, latencies
+        self.eligibility = EligibilityIndex(workers, self.metrics)
+        self.events = events if events is not None else NullSink()  # Per-event log, silent by default
+        self.event_queue = []
+        self.current_time = 0  # Simulation time in minutes
+        self.pending = PendingTasks(self.eligibility, self.deadline_minutes)
+        self.time_offset = 0  # For normalizing past timestamps
+        self.simulation_started = False
+        self.completion_times: Dict[str, float] = {}  # Task name -> minute it finished
+        self.task_workers: Dict[Task, Worker] = {}  # Queued or running task -> its worker
+        self._arrivals: Optional[Iterator[Task]] = None  # Lazily read stream of arrivals
+        self._next_arrival: Optional[Event] = None
+        self._index_fleet()
+
+    def add_task(self, task: Task):
+        """Add task with proper time normalization"""
+        heappush(self.event_queue, Event(EventType.TASK_ARRIVAL, self._arrival_minutes(task), task))
+
+    def add_task_stream(self, tasks: Iterable[Task]):
+        """Feed tasks already ordered by arrival time, e.g. from iter_tasks_in_range
+
+        The stream is read one task ahead of the simulation clock instead of being
+        pushed into the event heap up front. It replaces any earlier stream.
+        """
+        self._arrivals = iter(tasks)
+        self._next_arrival = self._read_arrival()
+
+    def run_simulation(self, end_time_minutes: float = 8*60):
+        """Run the simulation until the events run out or the clock passes end_time_minutes"""
+        if self.verbose:
+            print(self._start_message())
+        if self.eligibility.refresh():
+            self._index_fleet()
+            self.pending.reindex()
+            self._fleet_changed()
+        metrics = self.metrics
+        started = perf_counter()
+        processed = 0
+
+        while (self.event_queue or self._next_arrival is not None) and self.current_time <= end_time_minutes:
+            processed += self._process_batch()
+            self._schedule()
+
+        if metrics.enabled:
+            self._record_rate(processed, perf_counter() - started)
+        self._finish()
+        if self.verbose:
+            self._print_report()
+
+    def deadline_minutes(self, task: Task) -> float:
+        """Deadline on the simulation clock; numeric due dates already are"""
+        return task.deadline + self.time_offset if task.deadline_is_date else task.deadline
+
+    # Policy hooks
+
+    @abstractmethod
+    def _start_message(self) -> str:
+        """Line printed when the simulation starts"""
+
+    def _fleet_changed(self):
+        """Called after the eligibility index was rebuilt for a changed fleet"""
+
+    @abstractmethod
+    def _admit(self, task: Task):
+        """Take an arrived task into the pending set"""
+
+    def _task_finished(self, worker: Worker):
+        """Called after a worker finished a task and started its next one, if any"""
+
+    def _handle_replan(self):
+        """Called for a REPLAN wake-up event"""
+
+    @abstractmethod
+    def _schedule(self):
+        """One scheduler pass after each batch of events"""
+
+    def _finish(self):
+        """Called once the event loop has stopped"""
+
+    @abstractmethod
+    def _print_report(self):
+        """Final report printed when verbose"""
+
+    # Event loop
+
+    def _read_arrival(self) -> Optional[Event]:
+        task = next(self._arrivals, None)
+        if task is None:
+            return None
+        return Event(EventType.TASK_ARRIVAL, self._arrival_minutes(task), task)
+
+    def _next_event(self) -> Event:
+        """Earliest of the next streamed arrival and the event heap"""
+        arrival = self._next_arrival
+        if arrival is not None and (not self.event_queue or arrival.time < self.event_queue[0].time):
+            self._next_arrival = self._read_arrival()
+            return arrival
+        return heappop(self.event_queue)
+
+    def _arrival_minutes(self, task: Task) -> float:
+        """Arrival on the simulation clock; the first datetime arrival sets the offset"""
+        if not task.arrival_is_date:
+            return task.arrival
+        if not self.simulation_started:
+            self.time_offset = -task.arrival
+            self.simulation_started = True
+        return task.arrival + self.time_offset
+
+    def _process_batch(self) -> int:
+        """Handle the next event and every event up to coalesce_window minutes after it
+
+        Arrivals cluster on the same CREATED_DATE second, so with the default
+        window of 0 a burst of simultaneous events costs one scheduler pass.
+        Returns the number of events handled.
+        """
+        processed = 0
+        batch_end = None
+        while True:
+            event = self._next_event()
+            self.current_time = event.time
+            processed += 1
+
+            if event.event_type == EventType.TASK_ARRIVAL:
+                self._handle_task_arrival(event.task)
+            elif event.event_type == EventType.TASK_COMPLETION:
+                self._handle_task_completion(event.task, event.worker)
+            elif event.event_type == EventType.REPLAN:
+                self._handle_replan()
+
+            if self.metrics.enabled:
+                self._record_event(event)
+
+            if self.coalesce_window is None:
+                return processed
+            if batch_end is None:
+                batch_end = event.time + self.coalesce_window
+            if self._peek_time() > batch_end:
+                return processed
+
+    def _peek_time(self) -> float:
+        """Time of the next event without taking it, +inf when there is none"""
+        upcoming = self.event_queue[0].time if self.event_queue else float('inf')
+        if self._next_arrival is not None and self._next_arrival.time < upcoming:
+            return self._next_arrival.time
+        return upcoming
+
+    def _handle_task_arrival(self, task: Task):
+        """Process new task arrival"""
+        self._admit(task)
+        self.events.emit("task_arrived", self.current_time, task=task.name, priority=task.priority.name,
+                         duration=task.estimated_duration, tier=task.tier.name,
+                         resources=task.resource_requirements.name)
+
+    def _handle_task_completion(self, task: Task, worker: Optional[Worker] = None):
+        """Process task completion and start the worker's next task"""
+        if worker is None:
+            worker = self.task_workers.get(task)
+        if worker is None or worker.current_task is not task:
+            return
+        worker.complete_current_task()
+        del self.task_workers[task]
+        self.completion_times[task.name] = self.current_time
+        worker.current_load -= task.estimated_duration
+        self.events.emit("task_completed", self.current_time, worker=worker.name,
+                         task=task.name, priority=task.priority.name)
+        self._assign_next_task(worker)
+        self._task_finished(worker)
+
+    def _assign_next_task(self, worker: Worker):
+        """Start processing next task on worker"""
+        if worker.task_queue and worker.current_task is None:
+            next_task = worker.process_next_task()
+            completion_time = self.current_time + next_task.estimated_duration
+            heappush(self.event_queue,
+                     Event(EventType.TASK_COMPLETION, completion_time, next_task, worker))
+            self.events.emit("task_started", self.current_time, worker=worker.name,
+                             task=next_task.name, eta=completion_time)
+
+    def _index_fleet(self):
+        """Fleet position of every worker, rebuilt when the fleet changes"""
+        self._positions: Dict[Worker, int] = {w: k for k, w in enumerate(self.workers)}
+
+    def _record_event(self, event: Event):
+        """Count the event and sample the queue depths at its simulation time"""
+        self.metrics.inc(f"events.{event.event_type.name.lower()}")
+        self.metrics.gauge("pending_tasks", len(self.pending), self.current_time)
+        self.metrics.gauge("event_queue", len(self.event_queue), self.current_time)
+
+    def _record_rate(self, processed: int, elapsed: float):
+        self.metrics.inc("events.processed", processed)
+        self.metrics.gauge("events_per_second", processed / elapsed if elapsed > 0 else 0.0)
+
+    def _format_time(self, minutes: float) -> str:
+        """Convert minutes to HH:MM format"""
+        return f"{int(minutes//60):02d}:{int(minutes%60):02d}"
@@ -3,6 +3,7 @@ from src.model.task import Task, Tier, Priority, Resource
 from src.model.worker import Worker
 from src.scheduler.dynamic_grasp import DynamicGRASPScheduler
 from src.scheduler.dynamic_greedy import DynamicGREEDYScheduler
+from src.scheduler.event_log import ConsoleSink
 
 import src.input_handler.input_handler as handler
 
@@ -40,11 +41,11 @@ workers = [
 ]
 
 # Create scheduler
-scheduler = DynamicGRASPScheduler(workers, alpha=0.3)
+scheduler = DynamicGRASPScheduler(workers, alpha=0.3, events=ConsoleSink(), verbose=True)
 
 # Add tasks with different tiers and resources
 
-tasks = handler.create_tasks_from_csv("output_by_created_date/data_2025-04-06.csv")
+tasks = handler.load_tasks("output_by_created_date/data_2025-04-06.csv")
 
 for task in tasks:
     scheduler.add_task(task)
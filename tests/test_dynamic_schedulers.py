@@ -0,0 +1,159 @@
+import random
+from datetime import date, datetime, timedelta
+from heapq import heappop, heappush
+from pathlib import Path
+import pytest
+from replay import default_fleet, replay_day
+from src.model.task import Task, Priority, Tier, Resource
+from src.model.worker import Worker
+from src.scheduler.dynamic_grasp import DynamicGRASPScheduler
+from src.scheduler.dynamic_greedy import DynamicGREEDYScheduler, Event, EventType
+from src.scheduler.event_log import EventSink
+from src.scheduler.reactive import ReactiveAlpha
+from src.scheduler.simulation import EventDrivenScheduler
+
+START = datetime(2025, 4, 6, 9, 0)
+DATA_DIR = str(Path(__file__).resolve().parent.parent / "output_by_created_date")
+SCHEDULERS = (DynamicGREEDYScheduler, DynamicGRASPScheduler)
+
+def _task(name: str, due, arrival) -> Task:
+    return Task(name, Priority.MEDIUM, due, "sa-southeast-1", 10.0, Resource.LOW, Tier.TIER1, arrival)
+
+def _fleet():
+    return [Worker("W1", Tier.TIER5, ["sa-southeast-1"], 3)]
+
+@pytest.mark.parametrize("scheduler_class", SCHEDULERS)
+def test_numeric_times_stay_on_the_simulation_clock_after_a_datetime_task(scheduler_class, capsys):
+    scheduler = scheduler_class(_fleet())
+    scheduler.add_task(_task("dated", START + timedelta(hours=2), START))
+    numeric = _task("numeric", 60.0, 5.0)
+    scheduler.add_task(numeric)
+
+    assert scheduler.time_offset != 0
+    assert scheduler.deadline_minutes(numeric) == 60.0
+    scheduler.run_simulation(8 * 60)
+    assert scheduler.completion_times == {"dated": 10.0, "numeric": 20.0}
+
+def test_equal_time_events_pop_in_creation_order():
+    events = [Event(EventType.TASK_COMPLETION, 5.0) for _ in range(8)]
+    heap = []
+    for event in events[4:] + events[:4] + [Event(EventType.TASK_ARRIVAL, 1.0)]:
+        heappush(heap, event)
+    assert heappop(heap).time == 1.0
+    assert [heappop(heap) for _ in events] == events
+
+@pytest.mark.parametrize("scheduler_name, pending, violations", [
+    ("dynamic_greedy", 128, 0),
+    ("dynamic_grasp", 0, 127),
+])
+def test_replayed_day_outcome_is_pinned(scheduler_name, pending, violations):
+    # Read the CSV directly, so the test leaves no .tasks cache in the data directory
+    result = replay_day(date(2025, 1, 15), scheduler_name, DATA_DIR, seed=1, use_cache=False)
+    assert result["tasks"] == 1430
+    assert (result["pending"], result["violations"]) == (pending, violations)
+
+def test_outcome_does_not_depend_on_how_worker_regions_are_listed(capsys):
+    def completions(reverse: bool):
+        workers = [Worker(w.name, w.tier, sorted(w.regions, reverse=reverse), w.capacity)
+                   for w in default_fleet()]
+        scheduler = DynamicGREEDYScheduler(workers)
+        tasks = [_task(f"{k}", START + timedelta(minutes=90), START + timedelta(minutes=k // 3))
+                 for k in range(60)]
+        for task in tasks:
+            scheduler.add_task(task)
+        scheduler.run_simulation(8 * 60)
+        return scheduler.completion_times
+    assert completions(False) == completions(True)
+
+@pytest.mark.parametrize("seed", range(4))
+def test_reactive_alpha_is_not_swayed_by_backlog_size(seed, capsys):
+    # One GRASP run over 3 tasks, then one over 300: raw scores of the second
+    # run dwarf the first, whichever alphas each happened to sample
+    random.seed(seed)
+    rng = random.Random(seed)
+    reactive = ReactiveAlpha((0.1, 0.5, 0.9), period=6)
+    workers = [Worker(f"W{k}", Tier.TIER5, ["sa-southeast-1"], 3) for k in range(4)]
+    scheduler = DynamicGRASPScheduler(workers, alpha=reactive, iterations=3)
+    for k in range(3):
+        scheduler.add_task(_task(f"small-{k}", START + timedelta(hours=20), START))
+    for k in range(300):
+        task = _task(f"large-{k}", START + timedelta(hours=30), START + timedelta(hours=10))
+        task.set_priority(rng.choice(list(Priority)))
+        task.set_estimated_duration(rng.choice((5.0, 30.0, 60.0)))
+        scheduler.add_task(task)
+    scheduler.run_simulation(48 * 60)
+
+    assert max(reactive.probabilities) < 0.5
+
+def test_incomplete_scheduler_or_sink_fails_when_instantiated():
+    class NoPolicy(EventDrivenScheduler):
+        def _start_message(self) -> str:
+            return ""
+
+    class NoEmit(EventSink):
+        pass
+
+    with pytest.raises(TypeError):
+        NoPolicy(_fleet())
+    with pytest.raises(TypeError):
+        NoEmit()
+
+@pytest.mark.parametrize("scheduler_class", SCHEDULERS)
+def test_simulation_prints_only_when_verbose(scheduler_class, capsys):
+    for verbose in (False, True):
+        scheduler = scheduler_class(_fleet(), verbose=verbose)
+        scheduler.add_task(_task("dated", START + timedelta(hours=2), START))
+        scheduler.run_simulation(8 * 60)
+        assert bool(capsys.readouterr().out) == verbose
+
+class _Recorder(EventSink):
+    def __init__(self):
+        self.assigned = []
+
+    def emit(self, kind, time, **fields):
+        if kind == "task_assigned":
+            self.assigned.append((time, fields["task"], fields["worker"]))
+
+class _FullScanGREEDYScheduler(DynamicGREEDYScheduler):
+    """Reference pass: every pending task, re-sorted, tried against every feasible worker"""
+    def _schedule_pending_tasks(self):
+        self._arrived = []
+        self._lightened = {}
+        for task in self.pending.ordered():
+            now, deadline = self.current_time, self.deadline_minutes(task)
+            feasible_workers = [w for w in self.eligibility.feasible_workers(task)
+                                if now + w.current_load + task.estimated_duration <= deadline]
+            if not feasible_workers:
+                continue
+            selected_worker = min(feasible_workers, key=lambda w: w.current_load)
+            selected_worker.add_task(task)
+            self.task_workers[task] = selected_worker
+            self.pending.remove(task)
+            self.events.emit("task_assigned", self.current_time, task=task.name,
+                             worker=selected_worker.name, worker_tier=selected_worker.tier.name)
+            if selected_worker.current_task is None:
+                self._assign_next_task(selected_worker)
+
+@pytest.mark.parametrize("seed", range(5))
+def test_greedy_pass_matches_a_full_rescan(seed):
+    # Tight deadlines on a small fleet, so tasks wait, get picked up after
+    # completions, and some expire while pending
+    def run(scheduler_class):
+        rng = random.Random(seed)
+        regions = ["sa-southeast-1", "sa-southeast-2", "sa-unknown-1"]
+        workers = [Worker(f"W{k}", rng.choice([Tier.TIER3, Tier.TIER4, Tier.TIER5]),
+                          rng.sample(regions, rng.randint(1, 3)), rng.randint(1, 3)) for k in range(5)]
+        recorder = _Recorder()
+        scheduler = scheduler_class(workers, events=recorder, coalesce_window=None)
+        for k in range(150):
+            arrival = START + timedelta(minutes=rng.randint(0, 240))
+            task = Task(f"{k}", rng.choice(list(Priority)), arrival + timedelta(minutes=rng.randint(10, 180)),
+                        rng.choice(regions), rng.choice((5.0, 10.0, 15.0, 30.0, 60.0)),
+                        rng.choice(list(Resource)), rng.choice([Tier.TIER1, Tier.TIER2, Tier.TIER3]), arrival)
+            scheduler.add_task(task)
+        scheduler.run_simulation(24 * 60)
+        return recorder.assigned, scheduler.completion_times, len(scheduler.pending)
+
+    incremental, reference = run(DynamicGREEDYScheduler), run(_FullScanGREEDYScheduler)
+    assert len(reference[0]) > 50 and reference[2] > 0
+    assert incremental == reference
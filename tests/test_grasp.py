@@ -0,0 +1,23 @@
+import pickle
+from benchmarks.bench import make_fleet, make_tasks
+from src.scheduler.event_log import JsonlSink, NullSink
+from src.scheduler.grasp import GRASPScheduler
+
+def test_pool_workers_get_a_picklable_scheduler_without_the_event_sink(tmp_path):
+    with JsonlSink(str(tmp_path / "events.jsonl")) as events:
+        scheduler = GRASPScheduler(make_fleet(5), max_iterations=4, seed=0, events=events)
+        pool_copy = scheduler._pool_copy()
+
+        assert isinstance(pool_copy.events, NullSink)
+        assert scheduler.events is events
+        pickle.dumps(pool_copy)
+
+def test_parallel_run_with_a_file_sink_matches_the_serial_run(tmp_path):
+    tasks = make_tasks(200)
+    scores = []
+    for processes in (1, 2):
+        with JsonlSink(str(tmp_path / f"events-{processes}.jsonl")) as events:
+            scheduler = GRASPScheduler(make_fleet(5), max_iterations=8, seed=0,
+                                       processes=processes, events=events)
+            scores.append(list(scheduler.iter_solutions(tasks))[-1][0])
+    assert scores[0] == scores[1]
@@ -0,0 +1,34 @@
+from src.input_handler.input_handler import (COLUMNS, LoadReport, create_task_table_from_csv,
+                                             create_tasks_from_csv, iter_tasks_from_csv)
+
+ROWS = [
+    ",".join(COLUMNS),
+    "2025-04-06 18:00:00,2025-04-06 09:00:00,sa-southeast-1,10,HIGH,15,60,LOW",
+    "2025-04-06 18:00:00,2025-04-06 09:05:00,sa-southeast-1,7,HIGH,15,60,LOW",
+    "2025-04-06 18:00:00,2025-04-06 09:10:00,sa-southeast-1,15,URGENT,30,60,LOW",
+    "2025-04-06 18:00:00,2025-04-06 09:15:00,sa-southeast-1,15,LOW,30,soon,LOW",
+]
+
+def _write(tmp_path) -> str:
+    path = tmp_path / "data_2025-04-06.csv"
+    path.write_text("\n".join(ROWS) + "\n")
+    return str(path)
+
+def test_bad_tier_row_is_skipped_and_reported(tmp_path):
+    path = _write(tmp_path)
+    report = LoadReport(path)
+    tasks = list(iter_tasks_from_csv(path, report))
+
+    assert [task.name for task in tasks] == ["2", "4"]
+    assert tasks[1].priority.name == "MEDIUM"  # Invalid priority still falls back
+    assert report.rows_read == 4
+    assert report.loaded == 2
+    assert report.skipped == 2
+    assert [(w.row, w.field) for w in report.warnings] == [(3, "TIER"), (4, "PRIORITY"), (5, "row")]
+
+def test_streamed_and_table_loads_match_create_tasks_from_csv(tmp_path, capsys):
+    path = _write(tmp_path)
+    # The baseline loader reads the header as a bad row and skips it
+    expected = [task.name for task in create_tasks_from_csv(path)]
+    assert [task.name for task in iter_tasks_from_csv(path)] == expected
+    assert list(create_task_table_from_csv(path).row) == [int(name) for name in expected]
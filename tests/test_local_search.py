@@ -0,0 +1,85 @@
+import random
+from datetime import datetime, timedelta
+import pytest
+from src.model.task import Task, Priority, Tier, Resource, to_minutes
+from src.model.task_table import TaskTable
+from src.scheduler.assignment import UNASSIGNED, Assignment
+from src.scheduler.elite import path_relink
+from src.scheduler.evaluation import SolutionEvaluator
+from src.scheduler.local_search import MIN_GAIN, MODES, LocalSearch
+
+INSTANCES = 400
+START = datetime(2025, 4, 6, 9, 0)
+# Multiples of 0.5 add and subtract exactly, so loads can be compared with ==
+DURATIONS = (0.5, 1.0, 2.5, 5.0, 10.0, 15.0, 30.0, 60.0)
+
+def _instance(rng: random.Random):
+    """Random fleet size, eligibility classes and durations, with every row on a feasible worker"""
+    n_workers = rng.randint(2, 6)
+    class_workers = [frozenset(rng.sample(range(n_workers), rng.randint(1, n_workers)))
+                     for _ in range(rng.randint(1, 4))]
+    n_rows = rng.randint(2, 30)
+    row_class = [rng.randrange(len(class_workers)) for _ in range(n_rows)]
+    durations = [rng.choice(DURATIONS) for _ in range(n_rows)]
+    return n_workers, class_workers, row_class, durations
+
+def _random_assignment(rng: random.Random, n_workers, class_workers, row_class, durations) -> Assignment:
+    return Assignment.from_array(durations, n_workers,
+                                 [rng.choice(sorted(class_workers[c])) for c in row_class])
+
+def _assert_loads_match(candidate: Assignment):
+    loads = [0.0] * len(candidate.loads)
+    for row, position in enumerate(candidate.worker_of):
+        if position != UNASSIGNED:
+            loads[position] += candidate.durations[row]
+    assert candidate.loads == loads
+
+@pytest.mark.parametrize("mode", MODES)
+def test_local_search_stops_at_a_local_optimum(mode):
+    rng = random.Random(mode)
+    for _ in range(INSTANCES):
+        n_workers, class_workers, row_class, durations = _instance(rng)
+        candidate = _random_assignment(rng, n_workers, class_workers, row_class, durations)
+        LocalSearch(row_class, class_workers, mode=mode).run(candidate)
+
+        _assert_loads_match(candidate)
+        worker_of, loads = candidate.worker_of, candidate.loads
+        for row, position in enumerate(worker_of):
+            assert position in class_workers[row_class[row]]
+
+        # Moving x from load l_a to load l_b lowers the sum of squares by 2x(l_a - l_b - x)
+        for row, source in enumerate(worker_of):
+            for target in class_workers[row_class[row]] - {source}:
+                assert durations[row] * (loads[source] - loads[target] - durations[row]) <= MIN_GAIN
+                for other, position in enumerate(worker_of):
+                    if position == target and source in class_workers[row_class[other]]:
+                        delta = durations[row] - durations[other]
+                        assert delta * (loads[source] - loads[target] - delta) <= MIN_GAIN
+
+def test_path_relink_returns_the_evaluator_score_of_its_assignment():
+    rng = random.Random(0)
+    relinked = 0
+    for _ in range(INSTANCES):
+        n_workers, class_workers, row_class, durations = _instance(rng)
+        tasks = [Task(f"{row}", rng.choice(list(Priority)), START + timedelta(minutes=rng.randint(5, 120)),
+                      "sa-southeast-1", duration, Resource.LOW, Tier.TIER1, START)
+                 for row, duration in enumerate(durations)]
+        table = TaskTable.from_tasks(tasks)
+        order = table.sort_order()
+        evaluator = SolutionEvaluator(table, order, now=to_minutes(START))
+        start = _random_assignment(rng, n_workers, class_workers, row_class, table.duration)
+        guide = _random_assignment(rng, n_workers, class_workers, row_class, table.duration)
+
+        result = path_relink(start, guide, evaluator)
+        if result is None:
+            continue
+        relinked += 1
+        score, candidate = result
+
+        assert score == evaluator.score(candidate)
+        _assert_loads_match(candidate)
+        assert candidate.journal is None
+        for row, position in enumerate(candidate.worker_of):
+            assert position in (start.worker_of[row], guide.worker_of[row])
+            assert position in class_workers[row_class[row]]
+    assert relinked > INSTANCES // 2
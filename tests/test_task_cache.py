@@ -0,0 +1,71 @@
+import os
+import pytest
+from src.input_handler import task_cache
+from src.input_handler.input_handler import COLUMNS, create_task_table_from_csv
+from src.input_handler.task_cache import HEADER, cache_path_for, open_cache, write_cache
+
+ROWS = [
+    ",".join(COLUMNS),
+    "2025-04-06 18:00:00,2025-04-06 09:00:00,sa-southeast-1,10,HIGH,15,60,LOW",
+    "2025-04-06 19:00:00,2025-04-06 09:05:00,sa-southeast-2,15,LOW,30,60,HIGH",
+    "2025-04-06 20:00:00,2025-04-06 09:10:00,sa-unknown-1,0,MEDIUM,45,60,MEDIUM",
+]
+
+@pytest.fixture
+def cached_csv(tmp_path):
+    """A daily CSV with a cache written from it; returns the CSV path"""
+    path = str(tmp_path / "data_2025-04-06.csv")
+    with open(path, mode='w') as f:
+        f.write("\n".join(ROWS) + "\n")
+    write_cache(create_task_table_from_csv(path), path)
+    return path
+
+def _stamp(csv_path: str) -> int:
+    with open(cache_path_for(csv_path), mode='rb') as f:
+        return HEADER.unpack(f.read(HEADER.size))[5]
+
+def _rewrite(csv_path: str, old: str, new: str, keep_mtime: bool):
+    stat = os.stat(csv_path)
+    with open(csv_path) as f:
+        text = f.read()
+    with open(csv_path, mode='w') as f:
+        f.write(text.replace(old, new))
+    if keep_mtime:
+        os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+def test_fresh_cache_is_served(cached_csv):
+    table = open_cache(cached_csv)
+    expected = create_task_table_from_csv(cached_csv)
+
+    assert table is not None
+    assert len(table) == len(expected) == 3
+    assert list(table.duration) == list(expected.duration)
+    assert [task.name for task in table.tasks()] == [task.name for task in expected.tasks()]
+
+def test_touched_csv_is_served_and_restamped(cached_csv):
+    stat = os.stat(cached_csv)
+    touched = stat.st_mtime_ns + 5_000_000_000
+    os.utime(cached_csv, ns=(stat.st_atime_ns, touched))
+
+    assert open_cache(cached_csv) is not None
+    assert _stamp(cached_csv) == touched
+
+def test_size_change_makes_the_cache_stale(cached_csv):
+    _rewrite(cached_csv, ",60,LOW", ",600,LOW", keep_mtime=True)
+    assert open_cache(cached_csv) is None
+
+def test_same_size_edit_is_caught_by_the_hash(cached_csv):
+    # Same size and mtime: only the content hash can tell
+    _rewrite(cached_csv, "HIGH,15", "HIGH,25", keep_mtime=True)
+    assert open_cache(cached_csv) is not None
+    assert open_cache(cached_csv, check_hash=True) is None
+
+def test_same_size_edit_with_a_new_mtime_is_stale(cached_csv):
+    _rewrite(cached_csv, "HIGH,15", "HIGH,25", keep_mtime=False)
+    stat = os.stat(cached_csv)
+    os.utime(cached_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+    assert open_cache(cached_csv) is None
+
+def test_version_bump_makes_the_cache_stale(cached_csv, monkeypatch):
+    monkeypatch.setattr(task_cache, "CACHE_VERSION", task_cache.CACHE_VERSION + 1)
+    assert open_cache(cached_csv) is None